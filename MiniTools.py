@@ -12,10 +12,21 @@ import os
 import sys
 import subprocess
 import platform
+import datetime
+import contextlib
+import functools
+import queue
 import threading
 import re
+import shlex
 import shutil
+import string
 import tempfile
+import urllib.request
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Tuple, Callable
 from enum import Enum
@@ -32,7 +43,7 @@ from PyQt6.QtWidgets import (
     QProgressBar, QGroupBox, QScrollArea, QDialog, QDialogButtonBox,
     QButtonGroup, QRadioButton, QInputDialog, QSlider, QLineEdit, QSizePolicy, QTextBrowser
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer, QDateTime
+from PyQt6.QtCore import Qt, QThread, QProcess, QSocketNotifier, QFileSystemWatcher, pyqtSignal, QSize, QTimer, QDateTime
 from PyQt6.QtGui import QFont, QColor, QPalette, QIcon, QPixmap, QShortcut, QKeySequence, QPainter, QPen
 
 
@@ -48,36 +59,39 @@ class PlatformHelper:
     """Cross-platform helper for system-specific operations"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_platform() -> Platform:
-        """Detect current platform"""
-        system = platform.system().lower()
-        if system == "linux":
+        """Detect current platform (cached - the platform never changes at runtime)"""
+        # sys.platform is a constant baked in at interpreter build time,
+        # unlike platform.system() which probes the OS at runtime
+        if sys.platform.startswith("linux"):
             return Platform.LINUX
-        elif system == "windows":
+        elif sys.platform == "win32":
             return Platform.WINDOWS
-        elif system == "darwin":
+        elif sys.platform == "darwin":
             return Platform.MACOS
         return Platform.UNKNOWN
     
     @staticmethod
     def is_windows() -> bool:
         """Check if running on Windows"""
-        return PlatformHelper.get_platform() == Platform.WINDOWS
-    
+        return _IS_WINDOWS
+
     @staticmethod
     def is_linux() -> bool:
         """Check if running on Linux"""
-        return PlatformHelper.get_platform() == Platform.LINUX
-    
+        return _IS_LINUX
+
     @staticmethod
     def is_macos() -> bool:
         """Check if running on macOS"""
-        return PlatformHelper.get_platform() == Platform.MACOS
+        return _IS_MACOS
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_extensions_dir() -> str:
-        """Get the extensions directory path for current platform"""
-        if PlatformHelper.is_windows():
+        """Get the extensions directory path for current platform (cached)"""
+        if _IS_WINDOWS:
             # Windows: %APPDATA%\hotodogo\minitools\extensions
             appdata = os.environ.get('APPDATA')
             if not appdata:
@@ -85,10 +99,9 @@ class PlatformHelper:
                 home = os.path.expanduser('~')
                 appdata = os.path.join(home, 'AppData', 'Roaming')
             # Build extensions path using pathlib for better cross-platform handling
-            from pathlib import Path
             extensions_dir = Path(appdata) / 'hotodogo' / 'minitools' / 'extensions'
             return str(extensions_dir)
-        elif PlatformHelper.is_macos():
+        elif _IS_MACOS:
             # macOS: ~/Library/Application Support/hotodogo/minitools/extensions
             home = os.path.expanduser('~')
             return os.path.join(home, 'Library', 'Application Support', 'hotodogo', 'minitools', 'extensions')
@@ -97,6 +110,189 @@ class PlatformHelper:
             return os.path.expanduser('~/.config/hotodogo/minitools/extensions')
 
 
+# Platform identity is fixed for the life of the process, so fold the enum
+# comparison into plain booleans instead of calling through the helper
+_PLATFORM = PlatformHelper.get_platform()
+_IS_WINDOWS = _PLATFORM == Platform.WINDOWS
+_IS_LINUX = _PLATFORM == Platform.LINUX
+_IS_MACOS = _PLATFORM == Platform.MACOS
+
+# Windows-only modules used by the built-in system overview; importing them
+# here moves the repeated per-call import lookups to interpreter startup
+if _IS_WINDOWS:
+    import ctypes
+    import ctypes.wintypes as wintypes
+    import winreg
+
+    class DISPLAY_DEVICEW(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("DeviceName", wintypes.WCHAR * 32),
+            ("DeviceString", wintypes.WCHAR * 128),
+            ("StateFlags", wintypes.DWORD),
+            ("DeviceID", wintypes.WCHAR * 128),
+            ("DeviceKey", wintypes.WCHAR * 128),
+        ]
+
+# Resolved once at import - the extensions directory never changes during a session
+_EXTENSIONS_DIR = PlatformHelper.get_extensions_dir()
+
+# Byte-unit divisors, computed once instead of per formatted line
+_MIB = 1024 * 1024
+_GIB = 1024 ** 3
+
+
+@functools.lru_cache(maxsize=1)
+def _wmi_client():
+    """Shared WMI connection (Windows only) - each wmi.WMI() call spins up
+    a COM/DCOM session costing 50-200ms, so reuse a single client"""
+    import wmi
+    return wmi.WMI()
+
+
+# Matches "MemTotal:       16384 kB" style lines; keys with qualifiers such
+# as "Active(anon)" are skipped on purpose - the handlers never display them
+_MEMINFO_RE = re.compile(rb'^(\w+):\s+(\d+)', re.MULTILINE)
+
+# Boot timestamp line in /proc/stat
+_BTIME_RE = re.compile(r'btime (\d+)')
+
+# TYPE field in blkid output, e.g. TYPE="ext4"
+_BLKID_TYPE_RE = re.compile(r'\bTYPE="([^"]+)"')
+
+# Distribution ID line in /etc/os-release
+_OS_RELEASE_ID_RE = re.compile(r'^ID="?([^"\n]+)"?', re.MULTILINE)
+
+# URLs in log messages, converted to clickable links
+_URL_RE = re.compile(r'https?://[^\s<>"]+|www\.[^\s<>"]+')
+
+# Classifies an info line's severity in one C-level scan: error/warning/
+# success markers anchored at the start, plus the Installed/Available
+# mentions that may appear anywhere in the line
+_INFO_LINE_RE = re.compile(
+    r'^(?:(?P<err>Error:|✗)|(?P<warn>Warning:|⚠)|(?P<ok>✓))'
+    r'|(?P<mention>Installed|Available)')
+
+# Horizontal rule framing the info blocks in the log, built once instead of
+# re-concatenating 76 box-drawing characters on every _display_info call
+_SEP = "━" * 76
+
+# Package-manager output matchers, applied to the raw bytes output in one
+# C-level scan - no text-mode decode and no Python-level per-line filtering.
+# Each pattern matches one "interesting" line; blank lines never match
+# because every pattern requires a trailing non-space character.
+_APT_PKG_RE = re.compile(rb'^[^\r\n]*?/[^\r\n]*\S', re.MULTILINE)
+_DNF_PKG_RE = re.compile(rb'^(?!Last metadata|Upgraded Packages|Obsoleting)[^\r\n]*\S', re.MULTILINE)
+_PACMAN_PKG_RE = re.compile(rb'^[^\r\n]*\S', re.MULTILINE)
+_ZYPPER_PATCH_RE = re.compile(rb'^(?![S|+\-])[^\r\n]*\S', re.MULTILINE)
+
+# Pre-built footer blocks for the update checkers - appended as a single
+# element instead of a run of spacer + instruction appends
+_APT_FOOTER = "\n\nTo update, run:\n  sudo apt update && sudo apt upgrade"
+_DNF_FOOTER = "\n\nTo update, run:\n  sudo dnf upgrade"
+_PACMAN_FOOTER = "\n\nTo update, run:\n  sudo pacman -Syu"
+_ZYPPER_FOOTER = "\n\nTo update, run:\n  sudo zypper patch"
+_FLATPAK_FOOTER = "\n\nTo update Flatpak apps, run:\n  flatpak update"
+_FLATPAK_INSTALL_HELP = (
+    "Flatpak is not installed.\n\n"
+    "To install Flatpak:\n"
+    "  sudo apt install flatpak  # Debian/Ubuntu\n"
+    "  sudo dnf install flatpak  # Fedora/RHEL\n"
+    "  sudo pacman -S flatpak    # Arch"
+)
+
+
+def _link_repl(match) -> str:
+    """Wrap a matched URL in a styled anchor tag"""
+    url = match.group(0)
+    return f'<a href="{url}" style="color: #4da6ff; text-decoration: underline;">{url}</a>'
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_distro_id() -> str:
+    """Detect the Linux distribution ID from /etc/os-release (cached -
+    distro identity cannot change at runtime)"""
+    # /etc/os-release is ~1 KiB of static text; a raw-fd read skips the
+    # buffered-IO stack for this one-shot lookup
+    content = _read_small_files(("/etc/os-release",)).get("/etc/os-release")
+    if content is None:
+        return "unknown"
+    match = _OS_RELEASE_ID_RE.search(content)
+    if match:
+        distro = match.group(1).strip().lower()
+        if distro == "pika":
+            distro = "pikaos"
+        return distro
+    return "unknown"
+
+
+# tool name -> (resolved path, mtime, version string); keyed on the binary's
+# path and mtime so an upgrade or reinstall naturally invalidates the entry
+_tool_version_cache = {}
+
+
+def _cached_tool_version(tool: str) -> str:
+    """Version string reported by ``tool --version``, cached per binary
+
+    On the warm path this costs one PATH scan and one stat instead of a
+    fork/exec; returns an empty string when the tool is missing or the
+    probe fails.
+    """
+    path = shutil.which(tool)
+    if path is None:
+        return ""
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return ""
+    cached = _tool_version_cache.get(tool)
+    if cached is not None and cached[0] == path and cached[1] == mtime:
+        return cached[2]
+    try:
+        probe = subprocess.run([path, "--version"],
+                               capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    if probe.returncode != 0:
+        return ""
+    version = probe.stdout.strip()
+    _tool_version_cache[tool] = (path, mtime, version)
+    return version
+
+
+@functools.lru_cache(maxsize=1)
+def _lscpu_cached() -> str:
+    """Cached lscpu output - cache topology is static for the process lifetime"""
+    return ShellCommandHelper.get_command_output(["lscpu"])
+
+
+def _read_small_files(paths) -> dict:
+    """
+    Read a batch of small pseudo-files (/proc, /sys) in one pass
+
+    Uses raw os.open/os.read/os.close to skip the buffered-IO layer;
+    these files are tiny so a single 4 KiB read always suffices. Files
+    that cannot be opened are simply absent from the result.
+
+    Args:
+        paths: Iterable of file paths to read
+
+    Returns:
+        Dictionary mapping path to decoded file contents
+    """
+    contents = {}
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                contents[path] = os.read(fd, 4096).decode()
+            finally:
+                os.close(fd)
+        except OSError:
+            continue
+    return contents
+
+
 class ShellCommandHelper:
     """Helper class for executing shell commands"""
     
@@ -117,17 +313,16 @@ class ShellCommandHelper:
         try:
             stderr_target = subprocess.DEVNULL if silent else subprocess.PIPE
             stdout_target = subprocess.PIPE if capture_output else None
-            
-            # On Windows, use shell=True for some commands
-            shell = PlatformHelper.is_windows() and command[0] in ['cmd', 'powershell']
-            
+
+            # Always shell=False: every caller passes an argv list, and
+            # avoiding the shell lets CPython take the posix_spawn fast path
+            # instead of fork+exec (which copies the whole Qt process image)
             result = subprocess.run(
                 command,
                 stdout=stdout_target,
                 stderr=stderr_target,
                 text=True,
-                check=False,
-                shell=shell
+                check=False
             )
             
             stdout = result.stdout if capture_output else ""
@@ -160,7 +355,38 @@ class ShellCommandHelper:
                 return f.read().splitlines()
         except Exception:
             return []
-    
+
+    @staticmethod
+    def read_file_bytes(file_path: str) -> bytes:
+        """Read a file as raw bytes, return empty bytes on failure"""
+        try:
+            return Path(file_path).read_bytes()
+        except Exception:
+            return b""
+
+    @staticmethod
+    def parse_key_value_bytes(data: bytes, separator: bytes = b":") -> dict:
+        """
+        Parse raw "key: value" bytes into a str dict
+
+        Avoids decoding the whole file up front; only the matched keys and
+        values are decoded. ASCII-only pseudo-files like /proc/cpuinfo skip
+        the full UTF-8 decode and per-line str allocation entirely.
+
+        Args:
+            data: Raw file contents
+            separator: Separator between key and value
+
+        Returns:
+            Dictionary of key-value pairs
+        """
+        result = {}
+        for line in data.split(b"\n"):
+            if separator in line:
+                key, value = line.split(separator, 1)
+                result[key.strip().decode()] = value.strip().decode()
+        return result
+
     @staticmethod
     def parse_key_value_lines(lines: List[str], separator: str = ":") -> dict:
         """
@@ -189,22 +415,25 @@ class Config:
     MIN_LOG_FONT_SIZE = 6
     MAX_LOG_FONT_SIZE = 32
     LOG_FONT_FAMILY = "Consolas"
+
+    # Maximum number of blocks the log document keeps; Qt drops the oldest
+    # ones itself so log memory stays bounded
+    MAX_LOG_LINES = 10000
     
+    # Skip the themed QScrollBar rules and let the platform draw its
+    # native scrollbars; themed bars cost extra selector matching and
+    # repaints on every scroll
+    USE_NATIVE_SCROLLBARS = False
+
     # Window sizing
     MIN_WINDOW_WIDTH = 640
     MIN_WINDOW_HEIGHT = 480
     DEFAULT_WINDOW_WIDTH = 1200
     DEFAULT_WINDOW_HEIGHT = 900
     
-    # Extensions
-    EXTENSIONS_DIR = "~/.config/hotodogo/minitools/extensions"
-    
-    # Use PlatformHelper to get actual extensions directory
-    @staticmethod
-    def get_extensions_dir() -> str:
-        """Get the absolute path to the extensions directory"""
-        return PlatformHelper.get_extensions_dir()
-    
+    # Extensions directory, resolved once at import
+    EXTENSIONS_DIR = _EXTENSIONS_DIR
+
     # Colors for dark theme
     DARK_COLORS = {
         "info": "#d4d4d4",
@@ -227,7 +456,8 @@ class Config:
     LOG_LEVELS = [LogLevel.INFO.value, LogLevel.SUCCESS.value, LogLevel.WARNING.value, LogLevel.ERROR.value]
     
     # Supported script extensions
-    SUPPORTED_SCRIPT_EXTENSIONS = ['.sh', '.py']
+    # A tuple so str.endswith can take it directly
+    SUPPORTED_SCRIPT_EXTENSIONS = ('.sh', '.py')
     
     # Supported package managers
     SUPPORTED_DISTROS = {
@@ -240,118 +470,212 @@ class Config:
     @staticmethod
     def get_extensions_dir() -> str:
         """Get the absolute path to the extensions directory"""
-        return os.path.expanduser(Config.EXTENSIONS_DIR)
+        return Config.EXTENSIONS_DIR
+
+
+# Package-family membership and the per-family update commands, hoisted
+# so the install and update paths share one set of literals and test
+# membership against frozensets instead of rebuilding list literals
+_DEB_DISTROS = frozenset({"ubuntu", "debian", "mint", "pop", "zorin", "elementary"})
+_DNF_DISTROS = frozenset({"fedora", "nobara", "rhel", "centos", "almalinux", "rocky"})
+_ARCH_DISTROS = frozenset({"arch", "cachyos", "manjaro", "endeavouros", "xerolinux", "garuda"})
+_SUSE_DISTROS = frozenset({"opensuse-leap", "opensuse-tumbleweed", "sle"})
+# Anything rpm-based can take a plain .rpm install
+_RPM_DISTROS = _DNF_DISTROS | _SUSE_DISTROS
+
+_UPDATE_CMDS = {
+    "deb": ["pkexec", "sh", "-c", "apt update && apt upgrade -y"],
+    "dnf": ["pkexec", "sh", "-c", "dnf upgrade -y"],
+    "arch": ["pkexec", "sh", "-c", "pacman -Syu --noconfirm"],
+    "suse": ["pkexec", "sh", "-c", "zypper dup -y"],
+}
+
+
+def _distro_family(distro: str) -> Optional[str]:
+    """Map a distro ID to its package family, or None if unknown"""
+    if distro in _DEB_DISTROS:
+        return "deb"
+    if distro in _DNF_DISTROS:
+        return "dnf"
+    if distro in _ARCH_DISTROS:
+        return "arch"
+    if distro in _SUSE_DISTROS:
+        return "suse"
+    return None
+
+
+@dataclass(frozen=True)
+class ButtonSpec:
+    """One action button: display text, handler method name, tooltip
+
+    Specs are plain data evaluated once at import; the window resolves
+    method names to bound handlers when it materializes a group, so no
+    closures or per-build literal lists are allocated.
+    """
+    text: str
+    method: str
+    tip: str
+
+
+_SYSTEM_INFO_SPECS = (
+    ButtonSpec("System Overview", "_auto_run_fetch_tool", "Show system overview using fastfetch/neofetch"),
+    ButtonSpec("CPU Info", "show_cpu_info", "Show processor details and usage"),
+    ButtonSpec("Memory Info", "show_memory_info", "Show RAM usage and statistics"),
+    ButtonSpec("Swap Info", "show_swap_info", "Show swap space usage"),
+    ButtonSpec("Kernel Info", "show_kernel_info", "Show kernel version and system details"),
+    ButtonSpec("Disk Info", "show_disk_info", "Show disk usage and mounts"),
+)
+
+_MAINTENANCE_SPECS = (
+    ButtonSpec("Check System Updates", "show_update_info", "Check for available system package updates"),
+    ButtonSpec("Install Package from File", "install_package_from_file", "Install package from file"),
+) + (() if _IS_WINDOWS else (
+    # Flatpak only exists on Linux
+    ButtonSpec("Check Flatpak Updates", "show_flatpak_update_info", "Check for available Flatpak updates"),
+    ButtonSpec("Remove Unused Flatpak Runtimes", "remove_unused_flatpak", "Remove unused Flatpak runtimes to free space"),
+))
+
+_DISK_SPECS = () if _IS_WINDOWS else (
+    ButtonSpec("Change Partition UUID", "change_partition_uuid", "Generate and change partition UUID"),
+)
+
+_IFLOW_SPECS = (
+    ButtonSpec("Install iFlow CLI", "install_iflow_cli",
+               "Show iFlow CLI installation instructions for Windows" if _IS_WINDOWS
+               else "Install iFlow CLI from official repository"),
+    ButtonSpec("Clear iFlow History", "clear_iflow_history",
+               "Show iFlow CLI history location on Windows" if _IS_WINDOWS
+               else "Clear iFlow CLI command history"),
+)
+
+_ABOUT_SPECS = (
+    ButtonSpec("About MiniTools", "show_about", "Show program information"),
+)
 
 
 class SystemInfoWorker(QThread):
-    """Worker thread for collecting system information"""
+    """Long-lived worker thread that services info requests from a queue
+
+    One instance is created per window and reused for every button press,
+    so no OS thread is spawned and torn down per click.
+    """
     data_ready = pyqtSignal(str, str)
     error_signal = pyqtSignal(str)
-    
-    # Map info types to handler methods
-    INFO_HANDLERS = {}
-    
-    def __init__(self, info_type: str):
+    # Interim status lines shown in the log while a check is still running
+    progress_signal = pyqtSignal(str)
+
+    # Map info types to handler method names, resolved with getattr in run().
+    # Class-level constants: nothing needs rebuilding per worker construction.
+    INFO_HANDLERS = {
+        "cpu": "get_cpu_info",
+        "memory": "get_memory_info",
+        "kernel": "get_kernel_info",
+        "swap": "get_swap_info",
+        "disk": "get_disk_info",
+        "update": "get_update_info",
+        "flatpak": "get_flatpak_update_info",
+        # Windows-specific handlers
+        "cpu_windows": "get_cpu_info_windows",
+        "memory_windows": "get_memory_info_windows",
+        "kernel_windows": "get_kernel_info_windows",
+        "swap_windows": "get_swap_info_windows",
+        "disk_windows": "get_disk_info_windows",
+        # macOS-specific handlers
+        "cpu_macos": "get_cpu_info_macos",
+        "memory_macos": "get_memory_info_macos",
+        "kernel_macos": "get_kernel_info_macos",
+        "swap_macos": "get_swap_info_macos",
+        "disk_macos": "get_disk_info_macos",
+    }
+
+    def __init__(self):
         super().__init__()
-        self.info_type = info_type
-        self._register_handlers()
-    
-    def _register_handlers(self):
-        """Register info type handlers"""
-        self.INFO_HANDLERS = {
-            "cpu": self.get_cpu_info,
-            "memory": self.get_memory_info,
-            "kernel": self.get_kernel_info,
-            "swap": self.get_swap_info,
-            "disk": self.get_disk_info,
-            "update": self.get_update_info,
-            "flatpak": self.get_flatpak_update_info
-        }
-        
-        # Register Windows-specific handlers
-        if PlatformHelper.is_windows():
-            self.INFO_HANDLERS.update({
-                "cpu_windows": self.get_cpu_info_windows,
-                "memory_windows": self.get_memory_info_windows,
-                "kernel_windows": self.get_kernel_info_windows,
-                "swap_windows": self.get_swap_info_windows,
-                "disk_windows": self.get_disk_info_windows
-            })
-        
-        # Register macOS-specific handlers
-        if PlatformHelper.is_macos():
-            self.INFO_HANDLERS.update({
-                "cpu_macos": self.get_cpu_info_macos,
-                "memory_macos": self.get_memory_info_macos,
-                "kernel_macos": self.get_kernel_info_macos,
-                "swap_macos": self.get_swap_info_macos,
-                "disk_macos": self.get_disk_info_macos
-            })
-    
+        self._requests = queue.Queue()
+
+    def request(self, info_type: str):
+        """Queue an info request, starting the worker thread on first use"""
+        self._requests.put(info_type)
+        if not self.isRunning():
+            self.start()
+
+    def stop(self):
+        """Ask the worker loop to exit after draining queued requests"""
+        self._requests.put(None)
+
+    def _handler(self, key: str):
+        """Look up the bound handler method for an info type key"""
+        name = self.INFO_HANDLERS.get(key)
+        return getattr(self, name) if name else None
+
     def run(self):
-        """Execute the appropriate info handler based on info_type"""
+        """Service info requests until stop() is called"""
+        while True:
+            info_type = self._requests.get()
+            if info_type is None:
+                break
+            self._dispatch(info_type)
+
+    def _dispatch(self, info_type: str):
+        """Execute the appropriate info handler for one request"""
         # Windows support
-        if PlatformHelper.is_windows() and self.info_type in ["update", "flatpak"]:
-            if self.info_type == "flatpak":
+        if _IS_WINDOWS and info_type in ["update", "flatpak"]:
+            if info_type == "flatpak":
                 self.error_signal.emit("This feature is not supported on Windows")
                 return
             # Windows updates are supported
             pass
-        if PlatformHelper.is_windows() and self.info_type in ["cpu", "memory", "kernel", "swap", "disk"]:
-            handler = self.INFO_HANDLERS.get(f"{self.info_type}_windows")
+        if _IS_WINDOWS and info_type in ["cpu", "memory", "kernel", "swap", "disk"]:
+            handler = self._handler(f"{info_type}_windows")
             if handler:
                 try:
                     handler()
                 except Exception as e:
                     self.error_signal.emit(f"Error: {str(e)}")
             else:
-                self.error_signal.emit(f"Windows support for {self.info_type} is not yet implemented")
+                self.error_signal.emit(f"Windows support for {info_type} is not yet implemented")
             return
-        
+
         # macOS support
-        if PlatformHelper.is_macos() and self.info_type in ["update", "flatpak"]:
+        if _IS_MACOS and info_type in ["update", "flatpak"]:
             self.error_signal.emit("This feature is not supported on macOS")
             return
-        if PlatformHelper.is_macos() and self.info_type in ["cpu", "memory", "kernel", "swap", "disk"]:
-            handler = self.INFO_HANDLERS.get(f"{self.info_type}_macos")
+        if _IS_MACOS and info_type in ["cpu", "memory", "kernel", "swap", "disk"]:
+            handler = self._handler(f"{info_type}_macos")
             if handler:
                 try:
                     handler()
                 except Exception as e:
                     self.error_signal.emit(f"Error: {str(e)}")
             else:
-                self.error_signal.emit(f"macOS support for {self.info_type} is not yet implemented")
+                self.error_signal.emit(f"macOS support for {info_type} is not yet implemented")
             return
-        
-        handler = self.INFO_HANDLERS.get(self.info_type)
+
+        handler = self._handler(info_type)
         if handler:
             try:
                 handler()
             except Exception as e:
                 self.error_signal.emit(f"Error: {str(e)}")
         else:
-            self.error_signal.emit(f"Unknown info type: {self.info_type}")
+            self.error_signal.emit(f"Unknown info type: {info_type}")
     
     def _emit_result(self, title: str, data: List[str]):
         """Emit data_ready signal with formatted result"""
         output = "\n".join(data)
         self.data_ready.emit(title, output)
     
-    def get_cpu_info(self):
-        super().__init__()
-        self.info_type = info_type
-    
     def get_cpu_info(self):
         """Get CPU information"""
         result = []
         
         try:
-            # Parse /proc/cpuinfo
-            cpuinfo_lines = ShellCommandHelper.read_file_lines("/proc/cpuinfo")
-            cpuinfo_data = ShellCommandHelper.parse_key_value_lines(cpuinfo_lines)
+            # Parse /proc/cpuinfo from raw bytes - no full text decode needed
+            cpuinfo_data = ShellCommandHelper.parse_key_value_bytes(
+                ShellCommandHelper.read_file_bytes("/proc/cpuinfo"))
             
             model_name = cpuinfo_data.get("model name")
-            processors = sum(1 for line in cpuinfo_lines if line.startswith("processor"))
+            # os.cpu_count() reads cached kernel data; no need to scan cpuinfo lines
+            processors = os.cpu_count() or 0
             cores = int(cpuinfo_data.get("cpu cores", 0))
             siblings = int(cpuinfo_data.get("siblings", 0))
             threads_per_core = siblings // cores if siblings > 0 and cores > 0 else 1
@@ -362,34 +686,37 @@ class SystemInfoWorker(QThread):
             result.append(f"Physical Cores: {cores}")
             result.append(f"Threads per Core: {threads_per_core}")
             
-            # Get current frequency
-            cpu_freq = ShellCommandHelper.get_command_output(["cat", "/proc/cpuinfo"])
-            freq_match = re.search(r'cpu MHz\s*:\s*([\d.]+)', cpu_freq)
-            if freq_match:
-                result.append(f"Current Frequency: {float(freq_match.group(1)):.2f} MHz")
+            # Get current frequency (already parsed into cpuinfo_data above)
+            cpu_mhz = cpuinfo_data.get("cpu MHz")
+            if cpu_mhz:
+                result.append(f"Current Frequency: {float(cpu_mhz):.2f} MHz")
             
-            # Get max/min frequency
-            for freq_type, label in [("cpuinfo_max_freq", "Max"), ("cpuinfo_min_freq", "Min")]:
-                freq_path = f"/sys/devices/system/cpu/cpu0/cpufreq/{freq_type}"
-                if os.path.exists(freq_path):
-                    freq_content = ShellCommandHelper.read_file_lines(freq_path)
-                    if freq_content:
-                        freq_khz = int(freq_content[0].strip())
-                        result.append(f"{label} Frequency: {freq_khz / 1000:.2f} MHz")
+            # Get max/min frequency - batch the tiny sysfs reads in one pass
+            freq_paths = {
+                "Max": "/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq",
+                "Min": "/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_min_freq",
+            }
+            freq_contents = _read_small_files(freq_paths.values())
+            for label, freq_path in freq_paths.items():
+                content = freq_contents.get(freq_path)
+                if content:
+                    freq_khz = int(content.strip())
+                    result.append(f"{label} Frequency: {freq_khz / 1000:.2f} MHz")
             
             # Get CPU usage
-            stat_output = ShellCommandHelper.get_command_output(["grep", "cpu", "/proc/stat"])
-            if stat_output:
-                lines = stat_output.strip().split("\n")
-                if len(lines) > 1:
-                    cpu_usage = self._calculate_cpu_usage(lines[0])
-                    result.append(f"CPU Usage: {cpu_usage:.1f}%")
+            stat_lines = [line for line in ShellCommandHelper.read_file_lines("/proc/stat")
+                          if line.startswith("cpu")]
+            if len(stat_lines) > 1:
+                cpu_usage = self._calculate_cpu_usage(stat_lines[0])
+                result.append(f"CPU Usage: {cpu_usage:.1f}%")
             
             # Get cache info
-            cache_info = ShellCommandHelper.get_command_output(["lscpu"])
+            cache_info = _lscpu_cached()
             for line in cache_info.split("\n"):
-                if any(cache in line for cache in ["L1d cache", "L1i cache", "L2 cache", "L3 cache"]):
-                    result.append(line.strip())
+                line = line.strip()
+                # startswith with a tuple is a single C-level check per line
+                if line.startswith(("L1d cache", "L1i cache", "L2 cache", "L3 cache")):
+                    result.append(line)
                     
         except Exception as e:
             result.append(f"Error reading CPU info: {str(e)}")
@@ -403,24 +730,23 @@ class SystemInfoWorker(QThread):
         total = sum(values)
         return 100 * (1 - idle / total) if total > 0 else 0
     
+    @staticmethod
+    def _parse_meminfo() -> dict:
+        """Parse /proc/meminfo into a dict of integer kB values"""
+        try:
+            data = Path("/proc/meminfo").read_bytes()
+        except OSError:
+            return {}
+        # A single C-level regex scan beats a per-line split/strip/int loop
+        return {key.decode(): int(value) for key, value in _MEMINFO_RE.findall(data)}
+
     def get_memory_info(self):
         """Get memory information"""
         result = []
-        
+
         try:
-            meminfo_lines = ShellCommandHelper.read_file_lines("/proc/meminfo")
-            mem_data = {}
-            
-            for line in meminfo_lines:
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    key = key.strip()
-                    value = value.strip().split()[0]
-                    try:
-                        mem_data[key] = int(value)
-                    except ValueError:
-                        continue
-            
+            mem_data = self._parse_meminfo()
+
             def to_mb(value_kb: int) -> int:
                 return value_kb // 1024
             
@@ -488,9 +814,9 @@ class SystemInfoWorker(QThread):
             pass
         
         try:
-            uptime = ShellCommandHelper.get_command_output(["cat", "/proc/uptime"])
-            if uptime:
-                uptime_seconds = float(uptime.split()[0])
+            uptime_lines = ShellCommandHelper.read_file_lines("/proc/uptime")
+            if uptime_lines:
+                uptime_seconds = float(uptime_lines[0].split()[0])
                 uptime_days = int(uptime_seconds // 86400)
                 uptime_hours = int((uptime_seconds % 86400) // 3600)
                 uptime_minutes = int((uptime_seconds % 3600) // 60)
@@ -500,11 +826,10 @@ class SystemInfoWorker(QThread):
             pass
         
         try:
-            boot_time = ShellCommandHelper.get_command_output(["cat", "/proc/stat"])
+            boot_time = "\n".join(ShellCommandHelper.read_file_lines("/proc/stat"))
             if boot_time:
-                btime_match = re.search(r'btime (\d+)', boot_time)
+                btime_match = _BTIME_RE.search(boot_time)
                 if btime_match:
-                    import datetime
                     boot_timestamp = int(btime_match.group(1))
                     boot_datetime = datetime.datetime.fromtimestamp(boot_timestamp)
                     result.append(f"Boot Time: {boot_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -518,22 +843,11 @@ class SystemInfoWorker(QThread):
         result = []
         
         try:
-            meminfo_lines = ShellCommandHelper.read_file_lines("/proc/meminfo")
-            mem_data = {}
-            
-            for line in meminfo_lines:
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    key = key.strip()
-                    value = value.strip().split()[0]
-                    try:
-                        mem_data[key] = int(value)
-                    except ValueError:
-                        continue
-            
+            mem_data = self._parse_meminfo()
+
             def to_mb(value_kb: int) -> int:
                 return value_kb // 1024
-            
+
             swap_total = to_mb(mem_data.get("SwapTotal", 0))
             swap_free = to_mb(mem_data.get("SwapFree", 0))
             swap_cached = to_mb(mem_data.get("SwapCached", 0))
@@ -553,10 +867,10 @@ class SystemInfoWorker(QThread):
                 result.append("Swap Devices:")
                 result.append(swap_output)
             
-            swappiness = ShellCommandHelper.get_command_output(["cat", "/proc/sys/vm/swappiness"])
-            if swappiness:
+            swappiness_lines = ShellCommandHelper.read_file_lines("/proc/sys/vm/swappiness")
+            if swappiness_lines:
                 result.append("")
-                result.append(f"Swappiness: {swappiness.strip()}")
+                result.append(f"Swappiness: {swappiness_lines[0].strip()}")
                     
         except Exception as e:
             result.append(f"Error reading swap info: {str(e)}")
@@ -568,22 +882,45 @@ class SystemInfoWorker(QThread):
         result = []
         
         try:
+            # Launch the independent probes concurrently so the refresh costs
+            # as much as the slowest command, not the sum of all three
+            def start(command):
+                try:
+                    return subprocess.Popen(
+                        command,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True
+                    )
+                except Exception:
+                    return None
+
+            procs = {name: start(cmd) for name, cmd in (
+                ("df", ["df", "-h"]),
+                ("lsblk", ["lsblk", "-f"]),
+                ("blkid", ["blkid"]),
+            )}
+
+            outputs = {}
+            for name, proc in procs.items():
+                if proc is None:
+                    outputs[name] = ""
+                    continue
+                stdout, _ = proc.communicate()
+                outputs[name] = stdout if proc.returncode == 0 else ""
+
             # Get disk usage
-            df_output = ShellCommandHelper.get_command_output(["df", "-h"])
             result.append("━━━━━━ Disk Usage ━━━━━━")
             result.append("")
-            for line in df_output.strip().split("\n"):
-                result.append(line)
+            result.extend(filter(None, outputs["df"].splitlines()))
             result.append("")
-            
+
             # Get block devices
-            lsblk_output = ShellCommandHelper.get_command_output(["lsblk", "-f"])
             result.append("━━━━━━ Block Devices ━━━━━━")
             result.append("")
-            for line in lsblk_output.strip().split("\n"):
-                result.append(line)
+            result.extend(filter(None, outputs["lsblk"].splitlines()))
             result.append("")
-            
+
             # Get mounted filesystems
             with open("/proc/mounts", "r") as f:
                 mounts = f.read()
@@ -599,19 +936,11 @@ class SystemInfoWorker(QThread):
             result.append("")
             
             # Get disk UUIDs
-            try:
-                uuids = subprocess.check_output(
-                    ["blkid"], 
-                    stderr=subprocess.DEVNULL, 
-                    text=True
-                )
+            uuids = outputs["blkid"]
+            if uuids:
                 result.append("━━━━━━ Disk UUIDs ━━━━━━")
                 result.append("")
-                for line in uuids.split("\n"):
-                    if line.strip():
-                        result.append(line)
-            except:
-                pass
+                result.extend(filter(None, uuids.splitlines()))
             
         except Exception as e:
             result.append(f"Error reading disk info: {str(e)}")
@@ -624,11 +953,9 @@ class SystemInfoWorker(QThread):
         result = []
         
         try:
-            import platform
-            import wmi
-            
-            c = wmi.WMI()
-            
+
+            c = _wmi_client()
+
             # Get CPU info
             for cpu in c.Win32_Processor():
                 result.append(f"Model: {cpu.Name}")
@@ -671,10 +998,10 @@ class SystemInfoWorker(QThread):
             mem = psutil.virtual_memory()
             swap = psutil.swap_memory()
             
-            total_mb = mem.total // (1024 * 1024)
-            available_mb = mem.available // (1024 * 1024)
-            used_mb = mem.used // (1024 * 1024)
-            free_mb = mem.free // (1024 * 1024)
+            total_mb = mem.total // _MIB
+            available_mb = mem.available // _MIB
+            used_mb = mem.used // _MIB
+            free_mb = mem.free // _MIB
             
             result.append(f"Total Memory: {total_mb} MB ({total_mb // 1024} GB)")
             result.append(f"Used Memory: {used_mb} MB ({used_mb // 1024} GB)")
@@ -684,9 +1011,9 @@ class SystemInfoWorker(QThread):
             result.append("")
             
             # Swap info
-            swap_total_mb = swap.total // (1024 * 1024)
-            swap_used_mb = swap.used // (1024 * 1024)
-            swap_free_mb = swap.free // (1024 * 1024)
+            swap_total_mb = swap.total // _MIB
+            swap_used_mb = swap.used // _MIB
+            swap_free_mb = swap.free // _MIB
             
             result.append(f"Total Swap: {swap_total_mb} MB ({swap_total_mb // 1024} GB)")
             result.append(f"Used Swap: {swap_used_mb} MB ({swap_used_mb // 1024} GB)")
@@ -706,7 +1033,6 @@ class SystemInfoWorker(QThread):
         result = []
         
         try:
-            import platform
             import psutil
             
             result.append(f"System: {platform.system()}")
@@ -718,7 +1044,6 @@ class SystemInfoWorker(QThread):
             
             # Get boot time
             boot_time = psutil.boot_time()
-            import datetime
             boot_datetime = datetime.datetime.fromtimestamp(boot_time)
             result.append(f"Boot Time: {boot_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
             
@@ -743,9 +1068,9 @@ class SystemInfoWorker(QThread):
             
             swap = psutil.swap_memory()
             
-            swap_total_mb = swap.total // (1024 * 1024)
-            swap_used_mb = swap.used // (1024 * 1024)
-            swap_free_mb = swap.free // (1024 * 1024)
+            swap_total_mb = swap.total // _MIB
+            swap_used_mb = swap.used // _MIB
+            swap_free_mb = swap.free // _MIB
             
             result.append(f"Total Swap: {swap_total_mb} MB ({swap_total_mb // 1024} GB)")
             result.append(f"Used Swap: {swap_used_mb} MB ({swap_used_mb // 1024} GB)")
@@ -753,8 +1078,7 @@ class SystemInfoWorker(QThread):
             result.append(f"Swap Usage: {swap.percent:.1f}%")
             
             # Get swap file info
-            import wmi
-            c = wmi.WMI()
+            c = _wmi_client()
             for pagefile in c.Win32_PageFileUsage():
                 result.append("")
                 result.append(f"Swap File: {pagefile.Name}")
@@ -780,29 +1104,40 @@ class SystemInfoWorker(QThread):
             # Get disk usage
             result.append("━━━━━━ Disk Usage ━━━━━━")
             result.append("")
-            for partition in psutil.disk_partitions():
+
+            # Query all partitions concurrently - a sleeping or optical drive
+            # can block GetDiskFreeSpaceEx for seconds, so the total latency
+            # should be the slowest drive, not the sum of all of them
+            def query_usage(partition):
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    result.append(f"Device: {partition.device}")
-                    result.append(f"Mountpoint: {partition.mountpoint}")
-                    result.append(f"File system: {partition.fstype}")
-                    result.append(f"Total: {usage.total // (1024**3)} GB")
-                    result.append(f"Used: {usage.used // (1024**3)} GB")
-                    result.append(f"Free: {usage.free // (1024**3)} GB")
-                    result.append(f"Usage: {usage.percent:.1f}%")
-                    result.append("")
+                    return psutil.disk_usage(partition.mountpoint)
                 except PermissionError:
+                    return None
+
+            partitions = psutil.disk_partitions()
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                usages = list(executor.map(query_usage, partitions))
+
+            for partition, usage in zip(partitions, usages):
+                if usage is None:
                     continue
-            
+                result.append(f"Device: {partition.device}")
+                result.append(f"Mountpoint: {partition.mountpoint}")
+                result.append(f"File system: {partition.fstype}")
+                result.append(f"Total: {usage.total // _GIB} GB")
+                result.append(f"Used: {usage.used // _GIB} GB")
+                result.append(f"Free: {usage.free // _GIB} GB")
+                result.append(f"Usage: {usage.percent:.1f}%")
+                result.append("")
+
             # Get disk drives using WMI
             try:
-                import wmi
-                c = wmi.WMI()
+                c = _wmi_client()
                 result.append("━━━━━━ Disk Drives ━━━━━━")
                 result.append("")
                 for disk in c.Win32_DiskDrive():
                     result.append(f"Model: {disk.Model}")
-                    result.append(f"Size: {int(disk.Size) // (1024**3)} GB")
+                    result.append(f"Size: {int(disk.Size) // _GIB} GB")
                     result.append(f"Interface: {disk.InterfaceType}")
                     result.append("")
             except ImportError:
@@ -822,9 +1157,6 @@ class SystemInfoWorker(QThread):
         result = []
         
         try:
-            import subprocess
-            import platform
-            
             # Get CPU info using sysctl
             # CPU brand and model
             brand = ShellCommandHelper.get_command_output(["sysctl", "-n", "machdep.cpu.brand_string"])
@@ -865,8 +1197,8 @@ class SystemInfoWorker(QThread):
                 cache_size = ShellCommandHelper.get_command_output(["sysctl", "-n", cache_type])
                 if cache_size and int(cache_size.strip()) > 0:
                     size_bytes = int(cache_size.strip())
-                    if size_bytes >= 1024 * 1024:
-                        result.append(f"{cache_name}: {size_bytes // (1024 * 1024)} MB")
+                    if size_bytes >= _MIB:
+                        result.append(f"{cache_name}: {size_bytes // _MIB} MB")
                     else:
                         result.append(f"{cache_name}: {size_bytes // 1024} KB")
             
@@ -903,10 +1235,10 @@ class SystemInfoWorker(QThread):
             
             mem = psutil.virtual_memory()
             
-            total_mb = mem.total // (1024 * 1024)
-            available_mb = mem.available // (1024 * 1024)
-            used_mb = mem.used // (1024 * 1024)
-            free_mb = mem.free // (1024 * 1024)
+            total_mb = mem.total // _MIB
+            available_mb = mem.available // _MIB
+            used_mb = mem.used // _MIB
+            free_mb = mem.free // _MIB
             
             result.append(f"Total Memory: {total_mb} MB ({total_mb // 1024} GB)")
             result.append(f"Used Memory: {used_mb} MB ({used_mb // 1024} GB)")
@@ -917,9 +1249,9 @@ class SystemInfoWorker(QThread):
             
             # Swap info
             swap = psutil.swap_memory()
-            swap_total_mb = swap.total // (1024 * 1024)
-            swap_used_mb = swap.used // (1024 * 1024)
-            swap_free_mb = swap.free // (1024 * 1024)
+            swap_total_mb = swap.total // _MIB
+            swap_used_mb = swap.used // _MIB
+            swap_free_mb = swap.free // _MIB
             
             if swap_total_mb > 0:
                 result.append(f"Total Swap: {swap_total_mb} MB ({swap_total_mb // 1024} GB)")
@@ -942,7 +1274,6 @@ class SystemInfoWorker(QThread):
         result = []
         
         try:
-            import platform
             import psutil
             
             result.append(f"System: {platform.system()}")
@@ -960,7 +1291,6 @@ class SystemInfoWorker(QThread):
             
             # Get boot time
             boot_time = psutil.boot_time()
-            import datetime
             boot_datetime = datetime.datetime.fromtimestamp(boot_time)
             result.append(f"Boot Time: {boot_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
             
@@ -992,9 +1322,9 @@ class SystemInfoWorker(QThread):
             
             swap = psutil.swap_memory()
             
-            swap_total_mb = swap.total // (1024 * 1024)
-            swap_used_mb = swap.used // (1024 * 1024)
-            swap_free_mb = swap.free // (1024 * 1024)
+            swap_total_mb = swap.total // _MIB
+            swap_used_mb = swap.used // _MIB
+            swap_free_mb = swap.free // _MIB
             
             if swap_total_mb > 0:
                 result.append(f"Total Swap: {swap_total_mb} MB ({swap_total_mb // 1024} GB)")
@@ -1033,20 +1363,32 @@ class SystemInfoWorker(QThread):
             # Get disk usage
             result.append("━━━━━━ Disk Usage ━━━━━━")
             result.append("")
-            for partition in psutil.disk_partitions():
+
+            # Probe all partitions concurrently - statvfs can stall on slow
+            # or remote mounts, so the scan should cost max-of-latencies
+            # rather than sum-of-latencies
+            def query_usage(partition):
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    result.append(f"Device: {partition.device}")
-                    result.append(f"Mountpoint: {partition.mountpoint}")
-                    result.append(f"File system: {partition.fstype}")
-                    result.append(f"Total: {usage.total // (1024**3)} GB")
-                    result.append(f"Used: {usage.used // (1024**3)} GB")
-                    result.append(f"Free: {usage.free // (1024**3)} GB")
-                    result.append(f"Usage: {usage.percent:.1f}%")
-                    result.append("")
+                    return psutil.disk_usage(partition.mountpoint)
                 except PermissionError:
+                    return None
+
+            partitions = psutil.disk_partitions()
+            with ThreadPoolExecutor(max_workers=min(8, max(1, len(partitions)))) as executor:
+                usages = list(executor.map(query_usage, partitions))
+
+            for partition, usage in zip(partitions, usages):
+                if usage is None:
                     continue
-            
+                result.append(f"Device: {partition.device}")
+                result.append(f"Mountpoint: {partition.mountpoint}")
+                result.append(f"File system: {partition.fstype}")
+                result.append(f"Total: {usage.total // _GIB} GB")
+                result.append(f"Used: {usage.used // _GIB} GB")
+                result.append(f"Free: {usage.free // _GIB} GB")
+                result.append(f"Usage: {usage.percent:.1f}%")
+                result.append("")
+
             # Get disk info using diskutil
             result.append("━━━━━━ Disk Drives ━━━━━━")
             result.append("")
@@ -1093,41 +1435,32 @@ class SystemInfoWorker(QThread):
         
         try:
             # Check if flatpak is installed
-            result.append("Checking for Flatpak updates...")
-            result.append("")
-            
-            check_cmd = subprocess.run(
+            self.progress_signal.emit("Checking for Flatpak updates...")
+
+            # Stream the pipe line by line - one pass, no full-output buffering
+            with subprocess.Popen(
                 ["flatpak", "remote-ls", "--updates"],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True
-            )
-            
+            ) as check_cmd:
+                packages = [line.strip() for line in check_cmd.stdout if line.strip()]
+
             if check_cmd.returncode == 0:
-                updates = check_cmd.stdout.strip()
-                if updates:
-                    packages = [line for line in updates.split("\n") if line.strip()]
+                if packages:
                     result.append(f"Available Flatpak updates: {len(packages)}")
                     result.append("")
-                    for pkg in packages[:50]:
-                        result.append(pkg)
+                    result.append("\n".join(packages[:50]))
                     if len(packages) > 50:
                         result.append(f"... and {len(packages) - 50} more packages")
-                    result.append("")
-                    result.append("")
-                    result.append("To update Flatpak apps, run:")
-                    result.append("  flatpak update")
+                    result.append(_FLATPAK_FOOTER)
                 else:
                     result.append("No Flatpak updates available.")
             else:
                 result.append("No Flatpak updates available.")
                 
         except FileNotFoundError:
-            result.append("Flatpak is not installed.")
-            result.append("")
-            result.append("To install Flatpak:")
-            result.append("  sudo apt install flatpak  # Debian/Ubuntu")
-            result.append("  sudo dnf install flatpak  # Fedora/RHEL")
-            result.append("  sudo pacman -S flatpak    # Arch")
+            result.append(_FLATPAK_INSTALL_HELP)
         except Exception as e:
             result.append(f"Error checking Flatpak updates: {str(e)}")
         
@@ -1136,70 +1469,64 @@ class SystemInfoWorker(QThread):
     
     def _detect_distro(self):
         """Detect the Linux distribution"""
-        if PlatformHelper.is_windows():
+        if _IS_WINDOWS:
             return "windows"
-        if PlatformHelper.is_macos():
+        if _IS_MACOS:
             return "macos"
-        
-        try:
-            with open("/etc/os-release", "r") as f:
-                content = f.read()
-            for line in content.split("\n"):
-                if line.startswith("ID="):
-                    distro = line.split("=", 1)[1].strip().strip('"').lower()
-                    if distro == "pika":
-                        distro = "pikaos"
-                    return distro
-        except (IOError, FileNotFoundError):
-            pass
-        return "unknown"
+        return _detect_distro_id()
     
     def _get_apt_updates(self):
         """Get updates for apt-based systems"""
         result = []
         
         try:
-            result.append("Checking for updates (apt)...")
-            result.append("")
-            
-            output = subprocess.check_output(
-                ["apt", "list", "--upgradable"], 
-                stderr=subprocess.DEVNULL, 
-                text=True
-            )
-            
-            packages = []
-            for line in output.split("\n"):
-                if "/" in line and line.strip():
-                    packages.append(line.strip())
-            
+            self.progress_signal.emit("Checking for updates (apt)...")
+
+            try:
+                # Prefer python-apt: it queries the already-built package
+                # cache in-process, skipping the fork and the second cache
+                # load that `apt list --upgradable` pays on every call
+                import apt
+
+                # Keep the "name/archive version" shape of the CLI output so
+                # the security-update count below still sees the archive name
+                cache = apt.Cache()
+                packages = [
+                    f"{pkg.name}/{pkg.candidate.origins[0].archive if pkg.candidate.origins else ''} "
+                    f"{pkg.candidate.version} [upgradable from: {pkg.installed.version}]"
+                    for pkg in cache if pkg.is_upgradable
+                ]
+            except ImportError:
+                # Scan the raw bytes output with one compiled-regex pass and
+                # only decode the lines that actually name a package
+                with subprocess.Popen(
+                    ["apt", "list", "--upgradable"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                ) as process:
+                    output = process.stdout.read()
+                if process.returncode != 0:
+                    raise subprocess.CalledProcessError(process.returncode, "apt")
+
+                packages = [line.decode("utf-8", "replace").strip()
+                            for line in _APT_PKG_RE.findall(output)]
+
             if packages:
                 result.append(f"Upgradable packages: {len(packages)}")
                 result.append("")
-                for pkg in packages[:50]:
-                    result.append(pkg)
+                result.append("\n".join(packages[:50]))
                 if len(packages) > 50:
                     result.append(f"... and {len(packages) - 50} more packages")
-                result.append("")
-                result.append("")
-                result.append("To update, run:")
-                result.append("  sudo apt update && sudo apt upgrade")
+                result.append(_APT_FOOTER)
             else:
                 result.append("No updates available.")
             
-            try:
-                security_output = subprocess.check_output(
-                    ["apt", "list", "--upgradable"],
-                    stderr=subprocess.DEVNULL,
-                    text=True
-                )
-                security_packages = [line for line in security_output.split("\n") if "security" in line.lower()]
-                if security_packages:
-                    result.append("")
-                    result.append(f"Security updates: {len(security_packages)}")
-            except:
-                pass
-            
+            # The upgradable list is already in memory - no need to ask apt again
+            security_packages = [pkg for pkg in packages if "security" in pkg.lower()]
+            if security_packages:
+                result.append("")
+                result.append(f"Security updates: {len(security_packages)}")
+
         except subprocess.CalledProcessError:
             result.append("Error: Unable to check for updates.")
         except Exception as e:
@@ -1212,86 +1539,86 @@ class SystemInfoWorker(QThread):
         result = []
         
         try:
-            result.append("Checking for updates (dnf)...")
-            result.append("")
-            
-            output = subprocess.check_output(
-                ["dnf", "check-update", "--quiet"],
-                stderr=subprocess.DEVNULL,
-                text=True
-            )
-            
-            packages = []
-            for line in output.split("\n"):
-                if line.strip() and not line.startswith(("Last metadata", "Upgraded Packages", "Obsoleting")):
-                    packages.append(line.strip())
-            
+            self.progress_signal.emit("Checking for updates (dnf)...")
+
+            try:
+                # Prefer the dnf Python API: querying the sack in-process
+                # avoids forking dnf and bootstrapping its stack a second time
+                import dnf
+
+                with dnf.Base() as base:
+                    base.read_all_repos()
+                    base.fill_sack()
+                    packages = [f"{p.name}.{p.arch}  {p.evr}"
+                                for p in base.sack.query().upgrades()]
+            except ImportError:
+                # Scan the raw bytes output with one compiled-regex pass; the
+                # noise prefixes are excluded by the pattern itself. Exit code
+                # 100 means "updates available" and the list is still valid,
+                # so only treat other non-zero codes as failures.
+                with subprocess.Popen(
+                    ["dnf", "check-update", "--quiet"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                ) as process:
+                    output = process.stdout.read()
+                if process.returncode not in (0, 100):
+                    raise subprocess.CalledProcessError(process.returncode, "dnf")
+
+                packages = [line.decode("utf-8", "replace").strip()
+                            for line in _DNF_PKG_RE.findall(output)]
+
             if packages:
                 result.append(f"Upgradable packages: {len(packages)}")
                 result.append("")
-                for pkg in packages[:50]:
-                    result.append(pkg)
+                result.append("\n".join(packages[:50]))
                 if len(packages) > 50:
                     result.append(f"... and {len(packages) - 50} more packages")
-                result.append("")
-                result.append("")
-                result.append("To update, run:")
-                result.append("  sudo dnf upgrade")
+                result.append(_DNF_FOOTER)
             else:
                 result.append("No updates available.")
             
-        except subprocess.CalledProcessError as e:
-            if e.returncode == 100:
-                result.append("Updates available, but unable to list details.")
-                result.append("")
-                result.append("To update, run:")
-                result.append("  sudo dnf upgrade")
-            else:
-                result.append("Error: Unable to check for updates.")
+        except subprocess.CalledProcessError:
+            result.append("Error: Unable to check for updates.")
         except Exception as e:
             result.append(f"Error: {str(e)}")
-        
+
         return result
-    
+
     def _get_pacman_updates(self):
         """Get updates for pacman-based systems"""
         result = []
         
         try:
-            result.append("Checking for updates (pacman)...")
-            result.append("")
-            
-            output = subprocess.check_output(
+            self.progress_signal.emit("Checking for updates (pacman)...")
+
+            # Scan the raw bytes output with one compiled-regex pass
+            with subprocess.Popen(
                 ["checkupdates"],
-                stderr=subprocess.DEVNULL,
-                text=True
-            )
-            
-            packages = []
-            for line in output.split("\n"):
-                if line.strip():
-                    packages.append(line.strip())
-            
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            ) as process:
+                output = process.stdout.read()
+            if process.returncode != 0:
+                raise subprocess.CalledProcessError(process.returncode, "checkupdates")
+
+            packages = [line.decode("utf-8", "replace").strip()
+                        for line in _PACMAN_PKG_RE.findall(output)]
+
             if packages:
                 result.append(f"Upgradable packages: {len(packages)}")
                 result.append("")
-                for pkg in packages[:50]:
-                    result.append(pkg)
+                result.append("\n".join(packages[:50]))
                 if len(packages) > 50:
                     result.append(f"... and {len(packages) - 50} more packages")
-                result.append("")
-                result.append("")
-                result.append("To update, run:")
-                result.append("  sudo pacman -Syu")
+                result.append(_PACMAN_FOOTER)
             else:
                 result.append("No updates available.")
             
         except subprocess.CalledProcessError as e:
             if e.returncode == 2:
                 result.append("Updates available.")
-                result.append("")
-                result.append("To update, run:")
-                result.append("  sudo pacman -Syu")
+                result.append(_PACMAN_FOOTER)
             else:
                 result.append("Error: Unable to check for updates.")
         except FileNotFoundError:
@@ -1308,28 +1635,29 @@ class SystemInfoWorker(QThread):
         result = []
         
         try:
-            result.append("Checking for updates (zypper)...")
-            result.append("")
-            
-            output = subprocess.check_output(
+            self.progress_signal.emit("Checking for updates (zypper)...")
+
+            # Scan the raw bytes output with one compiled-regex pass; the
+            # table chrome (header, separators) is excluded by the pattern
+            with subprocess.Popen(
                 ["zypper", "list-updates", "--type", "patch"],
-                stderr=subprocess.DEVNULL,
-                text=True
-            )
-            
-            patches = [line for line in output.split("\n") if line.strip() and not line.startswith(("S", "|", "-", "+"))]
-            
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            ) as process:
+                output = process.stdout.read()
+            if process.returncode != 0:
+                raise subprocess.CalledProcessError(process.returncode, "zypper")
+
+            patches = [line.decode("utf-8", "replace")
+                       for line in _ZYPPER_PATCH_RE.findall(output)]
+
             if patches:
                 result.append(f"Available patches: {len(patches)}")
                 result.append("")
-                for patch in patches[:50]:
-                    result.append(patch)
+                result.append("\n".join(patches[:50]))
                 if len(patches) > 50:
                     result.append(f"... and {len(patches) - 50} more patches")
-                result.append("")
-                result.append("")
-                result.append("To update, run:")
-                result.append("  sudo zypper patch")
+                result.append(_ZYPPER_FOOTER)
             else:
                 result.append("No updates available.")
             
@@ -1345,19 +1673,14 @@ class SystemInfoWorker(QThread):
         result = []
         
         try:
-            # Check if winget is available
-            check_cmd = subprocess.run(
-                ["winget", "--version"],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="ignore"
-            )
-            
-            if check_cmd.returncode == 0:
+            # Check if winget is available - cached probe, zero forks on
+            # the warm path
+            winget_version = _cached_tool_version("winget")
+
+            if winget_version:
                 result.append("Checking for updates (winget)...")
                 result.append("")
-                result.append(f"winget version: {check_cmd.stdout.strip()}")
+                result.append(f"winget version: {winget_version}")
                 result.append("")
                 
                 # Get list of available updates
@@ -1404,16 +1727,10 @@ class SystemInfoWorker(QThread):
                 result.append("winget not found. Checking for chocolatey...")
                 result.append("")
                 
-                choco_check = subprocess.run(
-                    ["choco", "--version"],
-                    capture_output=True,
-                    text=True,
-                    encoding="utf-8",
-                    errors="ignore"
-                )
-                
-                if choco_check.returncode == 0:
-                    result.append(f"chocolatey version: {choco_check.stdout.strip()}")
+                choco_version = _cached_tool_version("choco")
+
+                if choco_version:
+                    result.append(f"chocolatey version: {choco_version}")
                     result.append("")
                     
                     # Get list of available updates
@@ -1469,697 +1786,36 @@ class SystemInfoWorker(QThread):
         return result
 
 
-class MiniToolsGUI(QMainWindow):
-    data_ready_signal = pyqtSignal(str, str)
-    error_signal = pyqtSignal(str)
-    
-    def __init__(self):
-        super().__init__()
-        
-        self.setWindowTitle(__app_name__)
-        
-        # Set window icon
-        self._set_window_icon()
-        
-        screen = self.screen().availableGeometry()
-        screen_width = screen.width()
-        screen_height = screen.height()
-        
-        min_width = max(Config.MIN_WINDOW_WIDTH, int(screen_width * 0.7))
-        min_height = max(Config.MIN_WINDOW_HEIGHT, int(screen_height * 0.7))
-        self.setMinimumSize(min_width, min_height)
-        
-        default_width = min(Config.DEFAULT_WINDOW_WIDTH, int(screen_width * 0.8))
-        default_height = min(Config.DEFAULT_WINDOW_HEIGHT, int(screen_height * 0.8))
-        self.resize(default_width, default_height)
-        
-        self.dark_mode = True
-        self.log_font_size = Config.DEFAULT_LOG_FONT_SIZE
-        self.info_worker = None
-        self.log_history = []  # Store log messages for theme refresh
-        
-        self.create_ui()
-        self.apply_theme()
-        self.center_window()
-        
-        self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", LogLevel.INFO)
-        self.log(f"{__app_name__} - Ready", LogLevel.INFO)
-        self.log(f"Version: {__version__}", LogLevel.INFO)
-        self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
-        self.log("Welcome! Click any button to use the tools.", LogLevel.INFO)
-        
-        # Auto-detect and run fastfetch/neofetch on startup
-        QTimer.singleShot(500, self._auto_run_fetch_tool)
-    
-    def _show_system_overview(self):
-        """Show quick system overview on startup"""
-        self.log("Loading system overview...", LogLevel.INFO)
-        self.show_cpu_info()
-    
-    def _auto_run_fetch_tool(self):
-        """Auto-detect and run fastfetch/neofetch on startup"""
-        # On Windows, use built-in fastfetch
-        if PlatformHelper.is_windows():
-            self._run_builtin_fastfetch()
-        # On Linux/macOS, check for fastfetch first
-        elif shutil.which("fastfetch"):
-            self.log("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", LogLevel.INFO)
-            self.log("Running fastfetch", LogLevel.SUCCESS)
-            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
-            self._run_fetch_command("fastfetch", "--pipe", "--structure", "title:separator:os:kernel:uptime:packages:shell:resolution:de:wm:theme:terminal:cpu:gpu:memory", "--logo", "none")
-        # Check for neofetch as fallback
-        elif shutil.which("neofetch"):
-            self.log("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", LogLevel.INFO)
-            self.log("Running neofetch", LogLevel.SUCCESS)
-            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
-            self._run_fetch_command("neofetch", "--config", "none", "--disable", "logo", "color", "cpu", "gpu")
-        else:
-            self.log("\nNote: fastfetch or neofetch not installed.", LogLevel.INFO)
-            self.log("Install one of them for better system overview.", LogLevel.INFO)
-            self.log("  Debian/Ubuntu: sudo apt install fastfetch")
-            self.log("  Fedora/RHEL: sudo dnf install fastfetch")
-            self.log("  Arch: sudo pacman -S fastfetch\n", LogLevel.INFO)
-    
-    def _run_fetch_command(self, command, *args):
-        """Run fetch command and display output"""
-        try:
-            cmd_list = [command] + list(args)
-            process = subprocess.Popen(
-                cmd_list,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            stdout, stderr = process.communicate()
-            
-            if process.returncode == 0:
-                # Display output line by line
-                for line in stdout.split('\n'):
-                    if line.strip():
-                        self.log(line, LogLevel.INFO)
-                self.log("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
-            else:
-                self.log(f"Error running {command}: {stderr}", LogLevel.ERROR)
-                
-        except Exception as e:
-            self.log(f"Error running {command}: {str(e)}", LogLevel.ERROR)
-    
-    def _run_builtin_fastfetch(self):
-        """Run built-in fastfetch for Windows"""
-        try:
-            import platform
-            import psutil
-            import wmi
-            import datetime
-            
-            self.log("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", LogLevel.INFO)
-            self.log("System Overview", LogLevel.SUCCESS)
-            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
-            
-            # OS Info
-            self.log(f"OS: {platform.system()} {platform.release()}", LogLevel.INFO)
-            
-            # Kernel/Version
-            self.log(f"Kernel: {platform.version()}", LogLevel.INFO)
-            
-            # Uptime
-            boot_time = psutil.boot_time()
-            uptime_seconds = datetime.datetime.now().timestamp() - boot_time
-            uptime_days = int(uptime_seconds // 86400)
-            uptime_hours = int((uptime_seconds % 86400) // 3600)
-            uptime_minutes = int((uptime_seconds % 3600) // 60)
-            self.log(f"Uptime: {uptime_days}d {uptime_hours}h {uptime_minutes}m", LogLevel.INFO)
-            
-            # Hostname
-            self.log(f"Host: {platform.node()}", LogLevel.INFO)
-            
-            # Shell
-            self.log("Shell: Windows PowerShell / CMD", LogLevel.INFO)
-            
-            # Resolution
-            try:
-                import ctypes
-                user32 = ctypes.windll.user32
-                width = user32.GetSystemMetrics(0)
-                height = user32.GetSystemMetrics(1)
-                self.log(f"Resolution: {width}x{height}", LogLevel.INFO)
-            except:
-                pass
-            
-            # DE/WM
-            self.log("DE/WM: Windows Desktop", LogLevel.INFO)
-            
-            # Theme
-            try:
-                import winreg
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
-                apps_use_light_theme = winreg.QueryValueEx(key, "AppsUseLightTheme")[0]
-                theme = "Light" if apps_use_light_theme else "Dark"
-                self.log(f"Theme: {theme}", LogLevel.INFO)
-                winreg.CloseKey(key)
-            except:
-                pass
-            
-            # Terminal
-            self.log("Terminal: Windows Terminal", LogLevel.INFO)
-            
-            # CPU
-            c = wmi.WMI()
-            for cpu in c.Win32_Processor():
-                self.log(f"CPU: {cpu.Name}", LogLevel.INFO)
-                self.log(f"     Cores: {cpu.NumberOfCores} | Threads: {cpu.NumberOfLogicalProcessors}", LogLevel.INFO)
-                self.log(f"     Max Speed: {cpu.MaxClockSpeed / 1000:.2f} GHz", LogLevel.INFO)
-                break
-            
-            # GPU
-            for gpu in c.Win32_VideoController():
-                self.log(f"GPU: {gpu.Name}", LogLevel.INFO)
-                self.log(f"     VRAM: {int(gpu.AdapterRAM) // (1024**2)} MB", LogLevel.INFO)
-                break
-            
-            # Memory
-            mem = psutil.virtual_memory()
-            self.log(f"Memory: {mem.total // (1024**3)} GB", LogLevel.INFO)
-            self.log(f"       Used: {mem.used // (1024**3)} GB ({mem.percent:.1f}%)", LogLevel.INFO)
-            self.log(f"       Available: {mem.available // (1024**3)} GB", LogLevel.INFO)
-            
-            self.log("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
-            
-        except ImportError as e:
-            self.log(f"Error: Required library not installed: {str(e)}", LogLevel.ERROR)
-            self.log("Please install: pip install psutil wmi", LogLevel.INFO)
-        except Exception as e:
-            self.log(f"Error running built-in fastfetch: {str(e)}", LogLevel.ERROR)
-    
-    def _set_window_icon(self):
-        """Set window icon for the application"""
-        try:
-            # For development mode, load icon from file
-            if not getattr(sys, 'frozen', False):
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                icon_path = None
-                
-                if PlatformHelper.is_windows():
-                    icon_path = os.path.join(script_dir, "minitools.ico")
-                elif PlatformHelper.is_macos():
-                    icon_path = os.path.join(script_dir, "minitools.icns")
-                else:
-                    # Linux: try .png or .svg
-                    if os.path.exists(os.path.join(script_dir, "minitools.png")):
-                        icon_path = os.path.join(script_dir, "minitools.png")
-                    elif os.path.exists(os.path.join(script_dir, "minitools.svg")):
-                        icon_path = os.path.join(script_dir, "minitools.svg")
-                
-                if icon_path and os.path.exists(icon_path):
-                    icon = QIcon(icon_path)
-                    self.setWindowIcon(icon)
-                    
-                    # Also set the application icon for Windows taskbar
-                    app = QApplication.instance()
-                    if app:
-                        app.setWindowIcon(icon)
-            # For compiled EXE, icon is embedded in the executable by PyInstaller
-            # No need to load it separately
-        except Exception as e:
-            # Fail silently - icon is not critical
-            pass
-    
-    def center_window(self):
-        """Center window on screen"""
-        frame = self.frameGeometry()
-        screen = self.screen().availableGeometry().center()
-        frame.moveCenter(screen)
-        self.move(frame.topLeft())
-    
-    def log(self, message: str, level: LogLevel = LogLevel.INFO) -> None:
-        """Add a message to the log
-        
-        Args:
-            message: The message to log
-            level: Log level (INFO, SUCCESS, WARNING, ERROR)
-        """
-        if not hasattr(self, 'log_text'):
-            return
-        
-        timestamp = QDateTime.currentDateTime().toString("HH:mm:ss")
-        
-        # Choose colors based on theme
-        colors = Config.DARK_COLORS if self.dark_mode else Config.LIGHT_COLORS
-        color = colors.get(level.value, colors[LogLevel.INFO.value])
-        timestamp_color = colors["timestamp"]
-        
-        # Convert URLs to clickable links
-        import re
-        url_pattern = r'https?://[^\s<>"]+|www\.[^\s<>"]+'
-        message_with_links = re.sub(
-            url_pattern,
-            lambda m: f'<a href="{m.group(0)}" style="color: #4da6ff; text-decoration: underline;">{m.group(0)}</a>',
-            message
-        )
-        
-        formatted_message = f'<span style="color: {timestamp_color};">[{timestamp}]</span> <span style="color: {color}; font-size: {self.log_font_size}pt;">{message_with_links}</span>'
-        
-        # Save to history
-        self.log_history.append((message, level.value))
-        
-        self.log_text.append(formatted_message)
-    
-    def toggle_theme(self):
-        """Toggle between dark and light themes"""
-        self.dark_mode = not self.dark_mode
-        self.apply_theme()
-        
-        if self.dark_mode:
-            self.theme_toggle_btn.setText("☀")
-            self.theme_toggle_btn.setToolTip("Switch to Light Mode")
-        else:
-            self.theme_toggle_btn.setText("🌙")
-            self.theme_toggle_btn.setToolTip("Switch to Dark Mode")
-        
-        self._update_right_scroll_style()
-        self._refresh_log_colors()  # Refresh log colors for new theme
-    
-    def _refresh_log_colors(self):
-        """Refresh all log messages with new theme colors"""
-        if not hasattr(self, 'log_text'):
-            return
-        
-        self.log_text.clear()
-        self._redisplay_log_messages(update_font=True)
-    
-    def _redisplay_log_messages(self, update_font: bool = False):
-        """
-        Re-display all log messages from history
-        
-        Args:
-            update_font: Whether to update font size in the messages
-        """
-        colors = Config.DARK_COLORS if self.dark_mode else Config.LIGHT_COLORS
-        
-        for message, level in self.log_history:
-            timestamp = QDateTime.currentDateTime().toString("HH:mm:ss")
-            color = colors.get(level, colors["info"])
-            timestamp_color = colors["timestamp"]
-            
-            if update_font:
-                formatted_message = f'<span style="color: {timestamp_color};">[{timestamp}]</span> <span style="color: {color}; font-size: {self.log_font_size}pt;">{message}</span>'
-            else:
-                formatted_message = f'<span style="color: {timestamp_color};">[{timestamp}]</span> <span style="color: {color};">{message}</span>'
-            
-            self.log_text.append(formatted_message)
-    
-    def confirm_exit(self):
-        """Confirm exit with dialog"""
-        reply = QMessageBox.question(
-            self,
-            "Exit Mini Tools",
-            "Are you sure you want to exit?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            self.close()
-    
-    def show_about(self):
-        """Show about information"""
-        about_text = f"""
-MiniTools<br>
-Version: {__version__}<br>
-<br>
-Dependencies:<br>
-- Python 3.6+<br>
-- PyQt6<br>
-<br>
-Author: {__author__}<br>
-<br>
-License: GNU General Public License v3.0 (GPL-3.0)<br>
-<br>
-This program is free software: you can redistribute it and/or modify<br>
-it under the terms of the GNU General Public License as published by<br>
-the Free Software Foundation, either version 3 of the License, or<br>
-(at your option) any later version.<br>
-<br>
-This program is distributed in the hope that it will be useful,<br>
-but WITHOUT ANY WARRANTY; without even the implied warranty of<br>
-MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the<br>
-GNU General Public License for more details.<br>
-<br>
-You should have received a copy of the GNU General Public License<br>
-along with this program.  If not, see &lt;<a href="https://www.gnu.org/licenses/">https://www.gnu.org/licenses/</a>&gt;.
-"""
-        
-        msg_box = QMessageBox(self)
-        msg_box.setWindowTitle("About MiniTools")
-        msg_box.setTextFormat(Qt.TextFormat.RichText)
-        msg_box.setText(about_text)
-        msg_box.setInformativeText(
-            'Repository: <a href="https://github.com/Perrolito/MiniTools.py">https://github.com/Perrolito/MiniTools.py</a>'
-        )
-        msg_box.exec()
-    
-    def change_partition_uuid(self):
-        """Change partition UUID"""
-        if PlatformHelper.is_windows():
-            self.log("\n" + "="*80, LogLevel.INFO)
-            self.log("Change Partition UUID - Not Available on Windows", LogLevel.WARNING)
-            self.log("="*80 + "\n", LogLevel.INFO)
-            self.log("This feature is not available on Windows.\n", LogLevel.INFO)
-            self.log("On Windows, you can use diskpart to manage disk IDs:\n", LogLevel.INFO)
-            self.log("1. Open Command Prompt as Administrator\n", LogLevel.INFO)
-            self.log("2. Run: diskpart\n", LogLevel.INFO)
-            self.log("3. Run: list disk\n", LogLevel.INFO)
-            self.log("4. Run: select disk X (replace X with disk number)\n", LogLevel.INFO)
-            self.log("5. Run: list partition\n", LogLevel.INFO)
-            self.log("6. Run: select partition Y (replace Y with partition number)\n", LogLevel.INFO)
-            self.log("7. Run: uniqueid disk\n", LogLevel.INFO)
-            return
-        
-        self.log("\n" + "="*80, LogLevel.INFO)
-        self.log("Change Partition UUID", LogLevel.WARNING)
-        self.log("="*80 + "\n", LogLevel.INFO)
-        
-        # Get partition device
-        partition_device, ok = QInputDialog.getText(
-            self,
-            "Change Partition UUID",
-            "Enter partition device (e.g., /dev/sda1):",
-            QLineEdit.EchoMode.Normal
-        )
-        
-        if not ok or not partition_device:
-            self.log("Operation cancelled.\n", LogLevel.INFO)
-            return
-        
-        partition_device = partition_device.strip()
-        
-        # Validate partition device
-        if not partition_device.startswith("/dev/"):
-            self.log(f"Error: Invalid partition device '{partition_device}'. Must start with /dev/\n", LogLevel.ERROR)
-            return
-        
-        self.log(f"Partition device: {partition_device}", LogLevel.INFO)
-        
-        # Detect partition filesystem type
-        self.log("Detecting partition filesystem type...", LogLevel.INFO)
-        try:
-            result = subprocess.run(
-                ["pkexec", "blkid", "-o", "value", "-s", "TYPE", partition_device],
-                capture_output=True,
-                text=True
-            )
-            filesystem = result.stdout.strip()
-            returncode = result.returncode
-            
-            self.log(f"blkid return code: {returncode}", LogLevel.INFO)
-            self.log(f"blkid stdout: '{filesystem}'", LogLevel.INFO)
-            if result.stderr:
-                self.log(f"blkid stderr: {result.stderr.strip()}", LogLevel.WARNING)
-            
-            if not filesystem:
-                self.log(f"Error: Could not detect filesystem type for {partition_device}\n", LogLevel.ERROR)
-                self.log("Possible reasons:", LogLevel.INFO)
-                self.log("  - Device does not exist", LogLevel.INFO)
-                self.log("  - Device is not a partition (may be a disk itself)", LogLevel.INFO)
-                self.log("  - Device has no filesystem (not formatted)", LogLevel.INFO)
-                self.log("  - Device is not accessible (permissions)\n", LogLevel.INFO)
-                return
-            
-            self.log(f"Detected filesystem: {filesystem}\n", LogLevel.SUCCESS)
-        except Exception as e:
-            self.log(f"Error detecting filesystem: {str(e)}\n", LogLevel.ERROR)
-            return
-        
-        # Show partition information
-        self.log("Partition Information:", LogLevel.INFO)
-        self.log(f"  Device: {partition_device}", LogLevel.INFO)
-        self.log(f"  Filesystem: {filesystem}", LogLevel.INFO)
-        
-        try:
-            result = subprocess.run(
-                ["pkexec", "blkid", partition_device],
-                capture_output=True,
-                text=True
-            )
-            self.log(f"  Current info: {result.stdout.strip()}", LogLevel.INFO)
-        except Exception as e:
-            self.log(f"  Could not get current info: {str(e)}", LogLevel.WARNING)
-        
-        self.log("")
-        
-        # Generate new UUID
-        import uuid
-        new_uuid = str(uuid.uuid4())
-        self.log(f"Generated new UUID: {new_uuid}\n", LogLevel.WARNING)
-        
-        # Show confirmation dialog with details
-        confirmation_text = f"""
-Are you sure you want to change the UUID for this partition?
+def _configure_layout(layout, spacing: int, margin: int) -> None:
+    """Set a layout's spacing and uniform margins in one place"""
+    layout.setSpacing(spacing)
+    layout.setContentsMargins(margin, margin, margin, margin)
 
-Partition Device: {partition_device}
-Filesystem: {filesystem}
-New UUID: {new_uuid}
 
-This operation will modify the partition's UUID.
-This may affect boot configuration and fstab entries.
+def _load_qss(filename: str, fallback: str) -> str:
+    """Load a stylesheet override from a .qss file next to the script.
 
-Please verify the information above is correct.
-"""
-        
-        reply = QMessageBox.question(
-            self,
-            "Confirm UUID Change",
-            confirmation_text,
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
-        if reply != QMessageBox.StandardButton.Yes:
-            self.log("Operation cancelled by user.\n", LogLevel.INFO)
-            return
-        
-        self.log("Changing partition UUID...", LogLevel.WARNING)
-        
-        # Execute UUID change command
-        try:
-            if filesystem in ["ext2", "ext3", "ext4"]:
-                command = ["pkexec", "tune2fs", "-U", new_uuid, partition_device]
-            elif filesystem in ["xfs"]:
-                command = ["pkexec", "xfs_admin", "-U", new_uuid, partition_device]
-            elif filesystem in ["btrfs"]:
-                command = ["pkexec", "btrfstune", "-u", new_uuid, partition_device]
-            elif filesystem in ["vfat", "fat32"]:
-                self.log("Warning: FAT32 filesystem does not support UUID change directly.\n", LogLevel.WARNING)
-                self.log("You may need to reformat the partition.\n", LogLevel.WARNING)
-                return
-            elif filesystem in ["swap"]:
-                command = ["pkexec", "mkswap", "-U", new_uuid, partition_device]
-            else:
-                self.log(f"Error: Unsupported filesystem '{filesystem}' for UUID change\n", LogLevel.ERROR)
-                self.log("Supported filesystems: ext2, ext3, ext4, xfs, btrfs, swap\n", LogLevel.INFO)
-                return
-            
-            self.log(f"Executing command: {' '.join(command)}\n", LogLevel.INFO)
-            
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            def read_output():
-                while True:
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output:
-                        self.log(output.strip(), LogLevel.INFO)
-                        QApplication.processEvents()
-            
-            import threading
-            output_thread = threading.Thread(target=read_output)
-            output_thread.daemon = True
-            output_thread.start()
-            
-            return_code = process.wait()
-            output_thread.join(timeout=2)
-            
-            if return_code == 0:
-                self.log("\n✓ Partition UUID changed successfully!\n", LogLevel.SUCCESS)
-                
-                # Show new partition info
-                try:
-                    result = subprocess.run(
-                        ["pkexec", "blkid", partition_device],
-                        capture_output=True,
-                        text=True
-                    )
-                    self.log("New partition info:", LogLevel.INFO)
-                    self.log(f"  {result.stdout.strip()}\n", LogLevel.INFO)
-                except Exception as e:
-                    self.log(f"Could not get new partition info: {str(e)}\n", LogLevel.WARNING)
-                
-                self.log("Note: If this is a boot partition, you may need to update:", "warning")
-                self.log("  - /etc/fstab entries", LogLevel.WARNING)
-                self.log("  - GRUB configuration (run: sudo update-grub)", LogLevel.WARNING)
-                self.log("  - Bootloader configuration\n", LogLevel.WARNING)
-            else:
-                self.log(f"\n✗ Failed to change partition UUID. Error code: {return_code}\n", LogLevel.ERROR)
-                
-        except Exception as e:
-            self.log(f"\n✗ Error during UUID change: {str(e)}\n", LogLevel.ERROR)
-    
-    def execute_extension_script(self, script_path, script_name):
-        """Execute extension script"""
-        self.log("\n" + "="*80, LogLevel.INFO)
-        self.log(f"Execute Extension: {script_name}", LogLevel.WARNING)
-        self.log("="*80 + "\n", LogLevel.INFO)
-        
-        # Show confirmation dialog
-        reply = QMessageBox.question(
-            self,
-            "Execute Extension Script",
-            f"Are you sure you want to execute this extension script?\n\nScript: {script_name}\nPath: {script_path}\n\nThis script will run with your user permissions.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
-        if reply != QMessageBox.StandardButton.Yes:
-            self.log("Operation cancelled.\n", LogLevel.INFO)
-            return
-        
-        self.log(f"Executing: {script_path}\n", LogLevel.WARNING)
-        
-        try:
-            # Determine how to run the script
-            if script_path.endswith('.sh'):
-                command = ["bash", script_path]
-            elif script_path.endswith('.py'):
-                command = [sys.executable, script_path]
-            else:
-                self.log(f"Error: Unsupported script type\n", LogLevel.ERROR)
-                return
-            
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            def read_output():
-                while True:
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output:
-                        self.log(output.strip(), LogLevel.INFO)
-                        QApplication.processEvents()
-            
-            import threading
-            output_thread = threading.Thread(target=read_output)
-            output_thread.daemon = True
-            output_thread.start()
-            
-            return_code = process.wait()
-            output_thread.join(timeout=2)
-            
-            if return_code == 0:
-                self.log(f"\n✓ Extension script executed successfully!\n", LogLevel.SUCCESS)
-            else:
-                self.log(f"\n✗ Extension script failed with exit code: {return_code}\n", LogLevel.ERROR)
-                
-        except Exception as e:
-            self.log(f"\n✗ Error executing extension script: {str(e)}\n", LogLevel.ERROR)
-    
-    def show_extensions_info(self):
-        """Show extensions information"""
-        self.log("\n" + "="*80, LogLevel.INFO)
-        self.log("Extensions Directory", LogLevel.INFO)
-        self.log("="*80 + "\n", LogLevel.INFO)
-        
-        self.log(f"Extensions path: {self.extensions_dir}", LogLevel.INFO)
-        self.log("", LogLevel.INFO)
-        
-        if not os.path.exists(self.extensions_dir):
-            self.log("Directory does not exist.", LogLevel.WARNING)
-            if PlatformHelper.is_windows():
-                self.log(f"Create it in File Explorer: {self.extensions_dir}", LogLevel.INFO)
-            else:
-                self.log(f"Create it with: mkdir -p {self.extensions_dir}", LogLevel.INFO)
-        else:
-            self.log("Directory exists.", LogLevel.SUCCESS)
-        
-        self.log("", LogLevel.INFO)
-        self.log("How to add extensions:", LogLevel.INFO)
-        self.log("1. Place .sh (shell) or .py (Python) scripts in the extensions directory", LogLevel.INFO)
-        self.log("2. Restart MiniTools to see your extensions", LogLevel.INFO)
-        self.log("3. Click an extension button to execute it", LogLevel.INFO)
-        self.log("", LogLevel.INFO)
-        self.log("Supported file types:", LogLevel.INFO)
-        self.log("  - .sh - Shell scripts (executed with bash)", LogLevel.INFO)
-        self.log("  - .py - Python scripts (executed with python3)", LogLevel.INFO)
-        self.log("", LogLevel.INFO)
-        self.log("Scripts will be executed with your user permissions.\n", LogLevel.WARNING)
-    
-    def zoom_in_log(self):
-        """Increase log font size"""
-        if not hasattr(self, 'log_text'):
-            return
-        
-        new_size = min(self.log_font_size + 1, Config.MAX_LOG_FONT_SIZE)
-        if new_size != self.log_font_size:
-            self.log_font_size = new_size
-            if hasattr(self, 'font_size_label'):
-                self.font_size_label.setText(str(self.log_font_size))
-            self._update_zoom_buttons()
-            self._refresh_log_with_new_size()
-    
-    def zoom_out_log(self):
-        """Decrease log font size"""
-        if not hasattr(self, 'log_text'):
-            return
-        
-        new_size = max(self.log_font_size - 1, Config.MIN_LOG_FONT_SIZE)
-        if new_size != self.log_font_size:
-            self.log_font_size = new_size
-            if hasattr(self, 'font_size_label'):
-                self.font_size_label.setText(str(self.log_font_size))
-            self._update_zoom_buttons()
-            self._refresh_log_with_new_size()
-    
-    def _refresh_log_with_new_size(self):
-        """Refresh log with new font size"""
-        if not hasattr(self, 'log_text'):
-            return
-        
-        self.log_text.clear()
-        self._redisplay_log_messages(update_font=True)
-    
-    def _update_zoom_buttons(self):
-        """Update zoom button states"""
-        if not hasattr(self, 'log_text') or not hasattr(self, 'zoom_in_btn') or not hasattr(self, 'zoom_out_btn'):
-            return
-        
-        self.zoom_in_btn.setEnabled(self.log_font_size < Config.MAX_LOG_FONT_SIZE)
-        self.zoom_out_btn.setEnabled(self.log_font_size > Config.MIN_LOG_FONT_SIZE)
-    
-    def apply_theme(self):
-        """Apply current theme (dark or light)"""
-        if self.dark_mode:
-            self._apply_dark_theme()
-        else:
-            self._apply_light_theme()
-    
-    def _apply_dark_theme(self):
-        """Apply modern dark theme"""
-        self.setStyleSheet("""
+    Keeps the multi-KB themes out of the hot path: the file (when
+    present) is read exactly once at import, and the built-in constant
+    is the fallback so the script still works as a single file. Frozen
+    builds skip the lookup — PyInstaller bundles only the script.
+    """
+    if getattr(sys, 'frozen', False):
+        return fallback
+    qss_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles", filename)
+    try:
+        with open(qss_path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return fallback
+
+
+# The theme stylesheets are multi-KB literals; building them per toggle
+# made every theme flip re-create the string before Qt even re-parsed
+# it. Hoisted here they are created once, and applying them at the
+# application level lets Qt propagate the style through its own cache
+# (and covers dialogs too).
+_DARK_QSS = """
             QMainWindow {
                 background-color: #1a1a1a;
             }
@@ -2297,9 +1953,214 @@ Please verify the information above is correct.
                 background-color: #252525;
                 border-color: #3d3d3d;
             }
-            /* Dialog Styles */
-            QDialog {
-                background-color: #252526;
+            QToolTip {
+                background-color: #1d1d1f;
+                color: #ffffff;
+                border: 1px solid #2d2d2f;
+                padding: 6px;
+                border-radius: 6px;
+                font-size: 11px;
+            }
+            QScrollArea#rightScroll {
+                background-color: #1c1c1c;
+                border: none;
+            }
+            QScrollBar:vertical {
+                background-color: #1c1c1c;
+                width: 12px;
+                border-radius: 6px;
+            }
+            QScrollBar::handle:vertical {
+                background-color: #3c3c3c;
+                border-radius: 6px;
+                min-height: 30px;
+            }
+            QScrollBar::handle:vertical:hover {
+                background-color: #4a4a4a;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                height: 0px;
+            }
+        """
+
+_LIGHT_QSS = """
+            QMainWindow {
+                background-color: #f5f5f5;
+            }
+            QWidget {
+                background-color: #f5f5f5;
+                color: #1d1d1f;
+                font-family: 'Inter', 'Segoe UI', system-ui, sans-serif;
+                font-size: 13px;
+            }
+            QFrame#topBar {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #ffffff, stop:1 #f5f5f7);
+                border-bottom: 2px solid #e5e5e7;
+            }
+            QLabel#titleLabel {
+                font-size: 20px;
+                font-weight: 600;
+                color: #1d1d1f;
+                letter-spacing: -0.5px;
+                background-color: transparent;
+                border: none;
+                padding: 0px;
+            }
+            QPushButton#themeToggle {
+                background-color: #e5e5e7;
+                color: #1d1d1f;
+                border: 1px solid #d0d0d0;
+                border-radius: 8px;
+                font-size: 18px;
+            }
+            QPushButton#themeToggle:hover {
+                background-color: #d5d5d7;
+                border-color: #c0c0c0;
+            }
+            QPushButton#exitButton {
+                background-color: #e5e5e7;
+                color: #1d1d1f;
+                border: 1px solid #d0d0d0;
+                border-radius: 8px;
+                font-size: 18px;
+            }
+            QPushButton#exitButton:hover {
+                background-color: #d32f2f;
+                border-color: #e53935;
+                color: #ffffff;
+            }
+            QPushButton#exitButton:pressed {
+                background-color: #b71c1c;
+            }
+            QWidget#contentArea {
+                background-color: #f5f5f5;
+            }
+            QFrame#infoCard {
+                background-color: #ffffff;
+                border: 1px solid #e0e0e0;
+                border-radius: 12px;
+            }
+            QLabel#sectionTitle {
+                font-size: 16px;
+                font-weight: 600;
+                color: #1d1d1f;
+                background-color: transparent;
+                border: none;
+                padding: 0px;
+            }
+            QFrame#logSection {
+                background-color: #ffffff;
+                border: 1px solid #e5e5e7;
+                border-radius: 8px;
+                padding: 12px;
+            }
+            QFrame#zoomToolbar {
+                background-color: transparent;
+                border: none;
+            }
+            QPushButton#zoomButton {
+                background-color: #e5e5e7;
+                color: #1d1d1f;
+                border: 1px solid #d0d0d0;
+                border-radius: 6px;
+                font-size: 18px;
+                font-weight: bold;
+            }
+            QPushButton#zoomButton:hover {
+                background-color: #d5d5d7;
+                border-color: #c0c0c0;
+            }
+            QPushButton#zoomButton:pressed {
+                background-color: #c5c5c7;
+            }
+            QPushButton#zoomButton:disabled {
+                background-color: #f5f5f7;
+                color: #86868b;
+                border-color: #e0e0e0;
+            }
+            QLabel#fontSizeLabel {
+                background-color: transparent;
+                color: #6c757d;
+                font-size: 12px;
+                font-weight: bold;
+                min-width: 24px;
+            }
+            QTextEdit#logText {
+                background-color: #ffffff;
+                color: #1d1d1f;
+                border: 1px solid #e5e5e7;
+                border-radius: 8px;
+                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+                padding: 12px;
+                selection-background-color: #007aff;
+            }
+            QFrame#buttonCard {
+                background-color: #ffffff;
+                border: 1px solid #e0e0e0;
+                border-radius: 12px;
+            }
+            QPushButton#actionButton {
+                background-color: #f5f5f7;
+                color: #1d1d1f;
+                border: 1px solid #e5e5e7;
+                padding: 12px 16px;
+                border-radius: 8px;
+                font-size: 13px;
+                font-weight: 500;
+                text-align: left;
+                min-width: 200px;
+            }
+            QPushButton#actionButton:hover {
+                background-color: #ffffff;
+                border-color: #d0d0d0;
+                color: #000000;
+            }
+            QPushButton#actionButton:pressed {
+                background-color: #e5e5e7;
+                border-color: #c0c0c0;
+            }
+            QToolTip {
+                background-color: #1d1d1f;
+                color: #ffffff;
+                border: 1px solid #2d2d2f;
+                padding: 6px;
+                border-radius: 6px;
+                font-size: 11px;
+            }
+            QScrollArea#rightScroll {
+                background-color: #f5f5f5;
+                border: none;
+            }
+            QScrollBar:vertical {
+                background-color: #f5f5f5;
+                width: 12px;
+                border-radius: 6px;
+            }
+            QScrollBar::handle:vertical {
+                background-color: #c0c0c0;
+                border-radius: 6px;
+                min-height: 30px;
+            }
+            QScrollBar::handle:vertical:hover {
+                background-color: #a0a0a0;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                height: 0px;
+            }
+        """
+
+# Optional on-disk overrides, resolved once at import so theme flips
+# never touch the filesystem.
+_DARK_QSS = _load_qss("dark.qss", _DARK_QSS)
+_LIGHT_QSS = _load_qss("light.qss", _LIGHT_QSS)
+
+# Dialog-only selectors split out of the application sheets. They are
+# installed on each dialog as it is created, so the hundreds of ordinary
+# widgets polished at startup never pay for matching these rules.
+_DARK_DIALOG_QSS = """
+            QDialog {
+                background-color: #252526;
                 color: #dcdcdc;
                 border-radius: 12px;
             }
@@ -2501,188 +2362,21 @@ Please verify the information above is correct.
             QFileDialog QPushButton[default="true"]:pressed {
                 background-color: #3db9a0;
             }
-            QToolTip {
-                background-color: #1d1d1f;
-                color: #ffffff;
-                border: 1px solid #2d2d2f;
-                padding: 6px;
-                border-radius: 6px;
-                font-size: 11px;
+        """
+
+_LIGHT_DIALOG_QSS = """
+            QDialog {
+                background-color: #ffffff;
+                color: #1d1d1f;
+                border-radius: 12px;
             }
-            QScrollArea#rightScroll {
-                background-color: #1c1c1c;
+            QDialog QLabel {
+                background-color: transparent;
                 border: none;
-            }
-            QScrollBar:vertical {
-                background-color: #1c1c1c;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #3c3c3c;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #4a4a4a;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
-    
-    def _apply_light_theme(self):
-        """Apply modern light theme"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QWidget {
-                background-color: #f5f5f5;
+                padding: 0px;
                 color: #1d1d1f;
-                font-family: 'Inter', 'Segoe UI', system-ui, sans-serif;
-                font-size: 13px;
-            }
-            QFrame#topBar {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f5f5f7);
-                border-bottom: 2px solid #e5e5e7;
             }
-            QLabel#titleLabel {
-                font-size: 20px;
-                font-weight: 600;
-                color: #1d1d1f;
-                letter-spacing: -0.5px;
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-            }
-            QPushButton#themeToggle {
-                background-color: #e5e5e7;
-                color: #1d1d1f;
-                border: 1px solid #d0d0d0;
-                border-radius: 8px;
-                font-size: 18px;
-            }
-            QPushButton#themeToggle:hover {
-                background-color: #d5d5d7;
-                border-color: #c0c0c0;
-            }
-            QPushButton#exitButton {
-                background-color: #e5e5e7;
-                color: #1d1d1f;
-                border: 1px solid #d0d0d0;
-                border-radius: 8px;
-                font-size: 18px;
-            }
-            QPushButton#exitButton:hover {
-                background-color: #d32f2f;
-                border-color: #e53935;
-                color: #ffffff;
-            }
-            QPushButton#exitButton:pressed {
-                background-color: #b71c1c;
-            }
-            QWidget#contentArea {
-                background-color: #f5f5f5;
-            }
-            QFrame#infoCard {
-                background-color: #ffffff;
-                border: 1px solid #e0e0e0;
-                border-radius: 12px;
-            }
-            QLabel#sectionTitle {
-                font-size: 16px;
-                font-weight: 600;
-                color: #1d1d1f;
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-            }
-            QFrame#logSection {
-                background-color: #ffffff;
-                border: 1px solid #e5e5e7;
-                border-radius: 8px;
-                padding: 12px;
-            }
-            QFrame#zoomToolbar {
-                background-color: transparent;
-                border: none;
-            }
-            QPushButton#zoomButton {
-                background-color: #e5e5e7;
-                color: #1d1d1f;
-                border: 1px solid #d0d0d0;
-                border-radius: 6px;
-                font-size: 18px;
-                font-weight: bold;
-            }
-            QPushButton#zoomButton:hover {
-                background-color: #d5d5d7;
-                border-color: #c0c0c0;
-            }
-            QPushButton#zoomButton:pressed {
-                background-color: #c5c5c7;
-            }
-            QPushButton#zoomButton:disabled {
-                background-color: #f5f5f7;
-                color: #86868b;
-                border-color: #e0e0e0;
-            }
-            QLabel#fontSizeLabel {
-                background-color: transparent;
-                color: #6c757d;
-                font-size: 12px;
-                font-weight: bold;
-                min-width: 24px;
-            }
-            QTextEdit#logText {
-                background-color: #ffffff;
-                color: #1d1d1f;
-                border: 1px solid #e5e5e7;
-                border-radius: 8px;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                padding: 12px;
-                selection-background-color: #007aff;
-            }
-            QFrame#buttonCard {
-                background-color: #ffffff;
-                border: 1px solid #e0e0e0;
-                border-radius: 12px;
-            }
-            QPushButton#actionButton {
-                background-color: #f5f5f7;
-                color: #1d1d1f;
-                border: 1px solid #e5e5e7;
-                padding: 12px 16px;
-                border-radius: 8px;
-                font-size: 13px;
-                font-weight: 500;
-                text-align: left;
-                min-width: 200px;
-            }
-            QPushButton#actionButton:hover {
-                background-color: #ffffff;
-                border-color: #d0d0d0;
-                color: #000000;
-            }
-            QPushButton#actionButton:pressed {
-                background-color: #e5e5e7;
-                border-color: #c0c0c0;
-            }
-            /* Dialog Styles */
-            QDialog {
-                background-color: #ffffff;
-                color: #1d1d1f;
-                border-radius: 12px;
-            }
-            QDialog QLabel {
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-                color: #1d1d1f;
-            }
-            QDialog QLabel#titleLabel {
+            QDialog QLabel#titleLabel {
                 background-color: transparent;
                 border: none;
                 padding: 0px;
@@ -2860,102 +2554,1071 @@ Please verify the information above is correct.
             QFileDialog QPushButton[default="true"]:pressed {
                 background-color: #3d8b40;
             }
-            QToolTip {
-                background-color: #1d1d1f;
-                color: #ffffff;
-                border: 1px solid #2d2d2f;
-                padding: 6px;
-                border-radius: 6px;
-                font-size: 11px;
-            }
-            QScrollArea#rightScroll {
-                background-color: #f5f5f5;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background-color: #f5f5f5;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #c0c0c0;
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #a0a0a0;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        """
+
+# The right-hand scroll area sheets differ only in their colors, so the
+# structure lives in one template and each theme is substituted exactly
+# once at import; toggles just swap the prebuilt strings.
+_RIGHT_SCROLL_TEMPLATE = string.Template("""
+    QScrollArea {
+        background-color: $bg;
+        border: none;
+    }
+    QScrollBar:vertical {
+        background-color: $bg;
+        width: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: $handle;
+        border-radius: 6px;
+        min-height: 30px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: $handle_hover;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+""")
+
+_RIGHT_SCROLL_DARK_QSS = _RIGHT_SCROLL_TEMPLATE.substitute(
+    bg="#1c1c1c", handle="#3c3c3c", handle_hover="#4a4a4a")
+_RIGHT_SCROLL_LIGHT_QSS = _RIGHT_SCROLL_TEMPLATE.substitute(
+    bg="#f5f5f5", handle="#c0c0c0", handle_hover="#a0a0a0")
+
+if Config.USE_NATIVE_SCROLLBARS:
+    # Strip every QScrollBar rule from the sheets once at import; the
+    # native style then renders the bars without QSS selector matching
+    _SCROLLBAR_RULE_RE = re.compile(r'\n\s*QScrollBar[^{]*\{[^}]*\}')
+    _DARK_QSS = _SCROLLBAR_RULE_RE.sub('', _DARK_QSS)
+    _LIGHT_QSS = _SCROLLBAR_RULE_RE.sub('', _LIGHT_QSS)
+    _RIGHT_SCROLL_DARK_QSS = _SCROLLBAR_RULE_RE.sub('', _RIGHT_SCROLL_DARK_QSS)
+    _RIGHT_SCROLL_LIGHT_QSS = _SCROLLBAR_RULE_RE.sub('', _RIGHT_SCROLL_LIGHT_QSS)
+
+
+def _minify_qss(sheet: str) -> str:
+    """Collapse whitespace runs so Qt's CSS lexer scans less input"""
+    return re.sub(r"\s+", " ", sheet).strip()
+
+
+# Minified once at import: identical rules, but the human-formatted
+# indentation is gone before Qt ever tokenizes a sheet
+_DARK_QSS = _minify_qss(_DARK_QSS)
+_LIGHT_QSS = _minify_qss(_LIGHT_QSS)
+_DARK_DIALOG_QSS = _minify_qss(_DARK_DIALOG_QSS)
+_LIGHT_DIALOG_QSS = _minify_qss(_LIGHT_DIALOG_QSS)
+_RIGHT_SCROLL_DARK_QSS = _minify_qss(_RIGHT_SCROLL_DARK_QSS)
+_RIGHT_SCROLL_LIGHT_QSS = _minify_qss(_RIGHT_SCROLL_LIGHT_QSS)
+
+
+class MiniToolsGUI(QMainWindow):
+    data_ready_signal = pyqtSignal(str, str)
+    error_signal = pyqtSignal(str)
+    # Batches of subprocess output lines, posted from reader threads; the
+    # queued connection marshals them to the GUI thread safely
+    log_batch_signal = pyqtSignal(list)
+    # (callback, returncode) pairs from finished streamed subprocesses,
+    # marshalled to the GUI thread before the callback runs
+    stream_finished_signal = pyqtSignal(object, int)
+
+    def __init__(self):
+        super().__init__()
+        
+        self.setWindowTitle(__app_name__)
+        
+        # Set window icon
+        self._set_window_icon()
+        
+        # availableGeometry walks out to the platform screen on every
+        # call; the UI builders below all size against the same screen,
+        # so resolve it once
+        self._screen_geom = self.screen().availableGeometry()
+        screen = self._screen_geom
+        screen_width = screen.width()
+        screen_height = screen.height()
+        
+        min_width = max(Config.MIN_WINDOW_WIDTH, int(screen_width * 0.7))
+        min_height = max(Config.MIN_WINDOW_HEIGHT, int(screen_height * 0.7))
+        self.setMinimumSize(min_width, min_height)
+        
+        default_width = min(Config.DEFAULT_WINDOW_WIDTH, int(screen_width * 0.8))
+        default_height = min(Config.DEFAULT_WINDOW_HEIGHT, int(screen_height * 0.8))
+        self.resize(default_width, default_height)
+        
+        # Resolved once - expanduser re-reads the environment per call and
+        # the file pickers only need a plain string start directory
+        self._home = os.path.expanduser("~")
+
+        self.dark_mode = True
+        # Active palette cache - re-pointed on theme change so per-line log
+        # calls do one attribute read instead of re-selecting the theme dict
+        self._active_colors = Config.DARK_COLORS
+        self.log_font_size = Config.DEFAULT_LOG_FONT_SIZE
+        # Bounded history kept alongside the document's own block cap: Qt's
+        # ring buffer bounds widget memory, but a theme flip needs the
+        # original text and levels to re-colorize, which toPlainText()
+        # cannot recover. Both bounds share Config.MAX_LOG_LINES.
+        self.log_history = deque(maxlen=Config.MAX_LOG_LINES)
+
+        # One long-lived worker services all info requests
+        self.info_worker = SystemInfoWorker()
+        self.info_worker.data_ready.connect(self._route_info)
+        self.info_worker.error_signal.connect(self._display_error)
+        self.info_worker.progress_signal.connect(self._display_progress)
+        self.log_batch_signal.connect(self._append_log_batch)
+        self.stream_finished_signal.connect(self._on_stream_finished)
+
+        # Subprocess output is buffered here and painted at ~30 Hz; the
+        # timer stops itself once the buffer runs dry
+        self._log_buffer = deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(33)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+        
+        self.create_ui()
+        self.apply_theme()
+        self.center_window()
+        
+        self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", LogLevel.INFO)
+        self.log(f"{__app_name__} - Ready", LogLevel.INFO)
+        self.log(f"Version: {__version__}", LogLevel.INFO)
+        self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
+        self.log("Welcome! Click any button to use the tools.", LogLevel.INFO)
+        
+        # Auto-detect and run fastfetch/neofetch on startup
+        QTimer.singleShot(500, self._auto_run_fetch_tool)
+    
+    def _show_system_overview(self):
+        """Show quick system overview on startup"""
+        self.log("Loading system overview...", LogLevel.INFO)
+        self.show_cpu_info()
+    
+    def _auto_run_fetch_tool(self):
+        """Auto-detect and run fastfetch/neofetch on startup"""
+        # On Windows, use built-in fastfetch
+        if _IS_WINDOWS:
+            self._run_builtin_fastfetch()
+        # On Linux/macOS, check for fastfetch first
+        elif shutil.which("fastfetch"):
+            self.log("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", LogLevel.INFO)
+            self.log("Running fastfetch", LogLevel.SUCCESS)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
+            self._run_fetch_command("fastfetch", "--pipe", "--structure", "title:separator:os:kernel:uptime:packages:shell:resolution:de:wm:theme:terminal:cpu:gpu:memory", "--logo", "none")
+        # Check for neofetch as fallback
+        elif shutil.which("neofetch"):
+            self.log("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", LogLevel.INFO)
+            self.log("Running neofetch", LogLevel.SUCCESS)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
+            self._run_fetch_command("neofetch", "--config", "none", "--disable", "logo", "color", "cpu", "gpu")
+        else:
+            self.log("\nNote: fastfetch or neofetch not installed.", LogLevel.INFO)
+            self.log("Install one of them for better system overview.", LogLevel.INFO)
+            self.log("  Debian/Ubuntu: sudo apt install fastfetch")
+            self.log("  Fedora/RHEL: sudo dnf install fastfetch")
+            self.log("  Arch: sudo pacman -S fastfetch\n", LogLevel.INFO)
+    
+    def _run_fetch_command(self, command, *args):
+        """Run fetch command asynchronously and display output when done
+
+        This runs on the GUI thread (via QTimer.singleShot), so a blocking
+        communicate() would freeze the window until the tool finishes.
+        QProcess lets the event loop keep painting while the tool runs.
+        """
+        try:
+            proc = QProcess(self)
+            # Keep a reference so the process is not garbage collected mid-run
+            self._fetch_process = proc
+            proc.finished.connect(
+                lambda exit_code, _status: self._on_fetch_finished(command, proc, exit_code)
+            )
+            proc.errorOccurred.connect(
+                lambda error: self.log(f"Error running {command}: {error.name}", LogLevel.ERROR)
+            )
+            proc.start(command, list(args))
+        except Exception as e:
+            self.log(f"Error running {command}: {str(e)}", LogLevel.ERROR)
+
+    def _on_fetch_finished(self, command, proc, exit_code):
+        """Display the fetch tool output once the process completes"""
+        if exit_code == 0:
+            stdout = bytes(proc.readAllStandardOutput()).decode("utf-8", "replace")
+            # Display output line by line
+            for line in stdout.split('\n'):
+                if line.strip():
+                    self.log(line, LogLevel.INFO)
+            self.log("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
+        else:
+            stderr = bytes(proc.readAllStandardError()).decode("utf-8", "replace")
+            self.log(f"Error running {command}: {stderr}", LogLevel.ERROR)
+
+        proc.deleteLater()
+        if getattr(self, '_fetch_process', None) is proc:
+            self._fetch_process = None
+    
+    def _run_builtin_fastfetch(self):
+        """Run built-in fastfetch for Windows"""
+        try:
+            import psutil
+
+            self.log("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", LogLevel.INFO)
+            self.log("System Overview", LogLevel.SUCCESS)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
+
+            # Collect every line, then post the block with a single log_raw
+            # call - one QTextEdit.append instead of ~15
+            overview = []
+
+            # OS Info
+            overview.append(f"OS: {platform.system()} {platform.release()}")
+
+            # Kernel/Version
+            overview.append(f"Kernel: {platform.version()}")
+
+            # Uptime
+            boot_time = psutil.boot_time()
+            uptime_seconds = datetime.datetime.now().timestamp() - boot_time
+            uptime_days = int(uptime_seconds // 86400)
+            uptime_hours = int((uptime_seconds % 86400) // 3600)
+            uptime_minutes = int((uptime_seconds % 3600) // 60)
+            overview.append(f"Uptime: {uptime_days}d {uptime_hours}h {uptime_minutes}m")
+
+            # Hostname
+            overview.append(f"Host: {platform.node()}")
+
+            # Shell
+            overview.append("Shell: Windows PowerShell / CMD")
+
+            # Resolution
+            try:
+                user32 = ctypes.windll.user32
+                width = user32.GetSystemMetrics(0)
+                height = user32.GetSystemMetrics(1)
+                overview.append(f"Resolution: {width}x{height}")
+            except:
+                pass
+
+            # DE/WM
+            overview.append("DE/WM: Windows Desktop")
+
+            # Theme
+            try:
+                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
+                apps_use_light_theme = winreg.QueryValueEx(key, "AppsUseLightTheme")[0]
+                theme = "Light" if apps_use_light_theme else "Dark"
+                overview.append(f"Theme: {theme}")
+                winreg.CloseKey(key)
+            except:
+                pass
+
+            # Terminal
+            overview.append("Terminal: Windows Terminal")
+
+            # CPU - read name/speed straight from the registry instead of a
+            # WQL query over DCOM (wmi.WMI() alone costs 50-200ms cold)
+            try:
+                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\CentralProcessor\0")
+                cpu_name = winreg.QueryValueEx(key, "ProcessorNameString")[0].strip()
+                cpu_mhz = winreg.QueryValueEx(key, "~MHz")[0]
+                winreg.CloseKey(key)
+                cores = psutil.cpu_count(logical=False) or os.cpu_count()
+                threads = os.cpu_count()
+                overview.append(f"CPU: {cpu_name}")
+                overview.append(f"     Cores: {cores} | Threads: {threads}")
+                overview.append(f"     Max Speed: {cpu_mhz / 1000:.2f} GHz")
+            except OSError:
+                pass
+
+            # GPU - enumerate display devices via user32 instead of Win32_VideoController
+            try:
+                device = DISPLAY_DEVICEW()
+                device.cb = ctypes.sizeof(device)
+                if ctypes.windll.user32.EnumDisplayDevicesW(None, 0, ctypes.byref(device), 0):
+                    overview.append(f"GPU: {device.DeviceString}")
+            except OSError:
+                pass
+
+            # Memory
+            mem = psutil.virtual_memory()
+            overview.append(f"Memory: {mem.total // _GIB} GB")
+            overview.append(f"       Used: {mem.used // _GIB} GB ({mem.percent:.1f}%)")
+            overview.append(f"       Available: {mem.available // _GIB} GB")
+
+            self.log_raw("\n".join(overview), LogLevel.INFO)
+            self.log("\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
+            
+        except ImportError as e:
+            self.log(f"Error: Required library not installed: {str(e)}", LogLevel.ERROR)
+            self.log("Please install: pip install psutil", LogLevel.INFO)
+        except Exception as e:
+            self.log(f"Error running built-in fastfetch: {str(e)}", LogLevel.ERROR)
+    
+    def _set_window_icon(self):
+        """Set window icon for the application"""
+        try:
+            # For development mode, load icon from file
+            if not getattr(sys, 'frozen', False):
+                script_dir = os.path.dirname(os.path.abspath(__file__))
+                icon_path = None
+                
+                if _IS_WINDOWS:
+                    icon_path = os.path.join(script_dir, "minitools.ico")
+                elif _IS_MACOS:
+                    icon_path = os.path.join(script_dir, "minitools.icns")
+                else:
+                    # Linux: try .png or .svg
+                    if os.path.exists(os.path.join(script_dir, "minitools.png")):
+                        icon_path = os.path.join(script_dir, "minitools.png")
+                    elif os.path.exists(os.path.join(script_dir, "minitools.svg")):
+                        icon_path = os.path.join(script_dir, "minitools.svg")
+                
+                if icon_path and os.path.exists(icon_path):
+                    icon = QIcon(icon_path)
+                    self.setWindowIcon(icon)
+                    
+                    # Also set the application icon for Windows taskbar
+                    app = QApplication.instance()
+                    if app:
+                        app.setWindowIcon(icon)
+            # For compiled EXE, icon is embedded in the executable by PyInstaller
+            # No need to load it separately
+        except Exception as e:
+            # Fail silently - icon is not critical
+            pass
+    
+    def center_window(self):
+        """Center window on screen"""
+        frame = self.frameGeometry()
+        screen = self._screen_geom.center()
+        frame.moveCenter(screen)
+        self.move(frame.topLeft())
+    
+    def log(self, message: str, level: LogLevel = LogLevel.INFO, *args) -> None:
+        """Add a message to the log
+
+        Args:
+            message: The message to log, optionally a %-format template
+            level: Log level (INFO, SUCCESS, WARNING, ERROR)
+            *args: Lazy format arguments, applied with ``message % args``
+                only once the message is known to be rendered (stdlib
+                logging style)
+        """
+        if not hasattr(self, 'log_text'):
+            return
+
+        if args:
+            message = message % args
+
+        timestamp = QDateTime.currentDateTime().toString("HH:mm:ss")
+
+        # Tolerate plain-string levels so a stray "warning" literal
+        # degrades to the info color instead of raising mid-operation
+        level_key = level.value if isinstance(level, LogLevel) else str(level)
+
+        # Save to history with the original timestamp so a theme refresh
+        # replays entries as they happened instead of re-stamping them
+        self.log_history.append((timestamp, message, level_key))
+
+        self.log_text.append(self._format_log_line(timestamp, message, level_key))
+
+    def _format_log_line(self, timestamp: str, message: str, level_key: str) -> str:
+        """Render one log entry as themed HTML"""
+        colors = self._active_colors
+        color = colors.get(level_key, colors[LogLevel.INFO.value])
+
+        # Convert URLs to clickable links; the cheap substring probe skips
+        # the regex entirely for the vast majority of lines with no URL
+        if "http" in message or "www." in message:
+            message = _URL_RE.sub(_link_repl, message)
+
+        return f'<span style="color: {colors["timestamp"]};">[{timestamp}]</span> <span style="color: {color};">{message}</span>'
+
+    def log_raw(self, message: str, level: LogLevel = LogLevel.INFO) -> None:
+        """Add a known-safe (no URLs, no markup) multi-line block to the log
+
+        Posts the whole block as a single QTextEdit.append instead of one
+        append (and one document relayout) per line.
+
+        Args:
+            message: The block to log; newlines are preserved
+            level: Log level (INFO, SUCCESS, WARNING, ERROR)
+        """
+        if not hasattr(self, 'log_text'):
+            return
+
+        timestamp = QDateTime.currentDateTime().toString("HH:mm:ss")
+
+        colors = self._active_colors
+        color = colors.get(level.value, colors[LogLevel.INFO.value])
+        timestamp_color = colors["timestamp"]
+
+        # QTextEdit.append treats the text as HTML, so newlines must become
+        # explicit breaks; store the converted form so redisplay matches
+        message_html = message.replace("\n", "<br>")
+        formatted_message = f'<span style="color: {timestamp_color};">[{timestamp}]</span> <span style="color: {color};">{message_html}</span>'
+
+        self.log_history.append((timestamp, message_html, level.value))
+
+        self.log_text.append(formatted_message)
+
+    def _append_log_batch(self, lines) -> None:
+        """Buffer a batch of subprocess output lines for the flush timer
+
+        Connected to log_batch_signal; runs on the GUI thread. Lines are
+        coalesced into _log_buffer and painted by the rate-limited timer,
+        so paint cost is capped at ~30 Hz no matter how fast the
+        subprocess produces output.
+        """
+        self._log_buffer.extend(lines)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log_buffer(self) -> None:
+        """Drain the buffered subprocess output into the log widget"""
+        if not self._log_buffer:
+            self._log_flush_timer.stop()
+            return
+
+        # Format the whole backlog up front - one timestamp fetch, one
+        # history pass - and hand it to the widget as a single append so
+        # the document lays out once per flush instead of once per line
+        timestamp = QDateTime.currentDateTime().toString("HH:mm:ss")
+        level_key = LogLevel.INFO.value
+        parts = []
+        while self._log_buffer:
+            message = self._log_buffer.popleft()
+            self.log_history.append((timestamp, message, level_key))
+            parts.append(self._format_log_line(timestamp, message, level_key))
+
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            self.log_text.append("<br>".join(parts))
+        finally:
+            self.log_text.setUpdatesEnabled(True)
+
+    @contextlib.contextmanager
+    def _log_batch(self):
+        """Batch a run of log calls into a single repaint/relayout cycle
+
+        Wrap multi-line sections (banners, info blocks) in
+        ``with self._log_batch():`` so the widget lays out once at the end
+        instead of once per line.
+        """
+        self.log_text.setUpdatesEnabled(False)
+        self.log_text.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.log_text.blockSignals(False)
+            self.log_text.setUpdatesEnabled(True)
+            self.log_text.ensureCursorVisible()
+
+    def _on_stream_finished(self, callback, return_code) -> None:
+        """Run a streamed-subprocess completion callback on the GUI thread"""
+        # Paint any still-buffered output first so the completion message
+        # lands after the last output line
+        self._flush_log_buffer()
+        if callback is not None:
+            callback(return_code)
+
+    def _stream_process(self, process, on_finished=None) -> None:
+        """Stream a Popen's output through the Qt event loop
+
+        On Unix a QSocketNotifier wakes the GUI thread whenever the pipe is
+        readable, so no reader thread and no blocking wait() are needed and
+        the window stays responsive for the whole run. Windows pipes cannot
+        feed QSocketNotifier, so a reader thread drains there instead; both
+        paths batch the output and report completion via
+        stream_finished_signal.
+
+        Args:
+            process: Popen with stdout=PIPE (binary mode)
+            on_finished: Optional callable invoked with the return code on
+                the GUI thread once the output is fully drained
+        """
+        fd = process.stdout.fileno()
+        state = {"pending": b""}
+
+        def emit_lines(data):
+            # Treat carriage returns as line breaks so pacman/dnf-style
+            # progress bars surface instead of pooling in the buffer
+            # until their final newline
+            state["pending"] += data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            lines = state["pending"].split(b"\n")
+            state["pending"] = lines.pop()
+            batch = [line.decode("utf-8", "replace").strip()
+                     for line in lines if line.strip()]
+            if batch:
+                self.log_batch_signal.emit(batch)
+
+        def emit_tail():
+            if state["pending"].strip():
+                self.log_batch_signal.emit(
+                    [state["pending"].decode("utf-8", "replace").strip()])
+
+        if _IS_WINDOWS:
+            def pump():
+                while True:
+                    data = os.read(fd, 65536)
+                    if not data:
+                        break
+                    emit_lines(data)
+                emit_tail()
+                self.stream_finished_signal.emit(on_finished, process.wait())
+
+            reader = threading.Thread(target=pump, daemon=True)
+            reader.start()
+            self._stream_reader = reader
+        else:
+            os.set_blocking(fd, False)
+            notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+
+            def on_activated(_socket):
+                while True:
+                    try:
+                        data = os.read(fd, 65536)
+                    except BlockingIOError:
+                        return
+                    if not data:
+                        break
+                    emit_lines(data)
+                # EOF: the process has closed its end, so wait() is prompt
+                notifier.setEnabled(False)
+                notifier.deleteLater()
+                emit_tail()
+                self.stream_finished_signal.emit(on_finished, process.wait())
+
+            notifier.activated.connect(on_activated)
+            self._stream_notifier = notifier
+
+        # Keep a reference so the process object outlives this call
+        self._stream_proc = process
+
+    def _run_streamed(self, command, on_finished=None) -> None:
+        """Launch a command and stream its output into the log
+
+        Single entry point for "run a tool and show its output live":
+        merges stderr into stdout, streams through _stream_process, and
+        calls on_finished(returncode) on the GUI thread. Optimizations to
+        the drain path land here once and apply to every caller.
+
+        Args:
+            command: Command list to execute
+            on_finished: Optional callable invoked with the return code
+        """
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
+        )
+        self._stream_process(process, on_finished)
+
+    def _run_capture(self, program, arguments, on_done) -> None:
+        """Run a command via QProcess and hand the result to a continuation
+
+        The GUI thread returns to the event loop while the command (and any
+        polkit prompt it triggers) runs; on_done is called with
+        (returncode, stdout, stderr) when it finishes.
+        """
+        proc = QProcess(self)
+        proc.setProgram(program)
+        proc.setArguments(arguments)
+
+        def finished(exit_code, _status):
+            stdout = bytes(proc.readAllStandardOutput()).decode("utf-8", "replace")
+            stderr = bytes(proc.readAllStandardError()).decode("utf-8", "replace")
+            proc.deleteLater()
+            on_done(exit_code, stdout, stderr)
+
+        proc.finished.connect(finished)
+        proc.errorOccurred.connect(
+            lambda error: (proc.deleteLater(), on_done(-1, "", error.name))
+            if error == QProcess.ProcessError.FailedToStart else None
+        )
+        self._capture_proc = proc
+        proc.start()
+    
+    def toggle_theme(self):
+        """Toggle between dark and light themes"""
+        self.dark_mode = not self.dark_mode
+        self.apply_theme()
+        
+        if self.dark_mode:
+            self.theme_toggle_btn.setText("☀")
+            self.theme_toggle_btn.setToolTip("Switch to Light Mode")
+        else:
+            self.theme_toggle_btn.setText("🌙")
+            self.theme_toggle_btn.setToolTip("Switch to Dark Mode")
+        
+        self._update_right_scroll_style()
+        self._refresh_log_colors()  # Refresh log colors for new theme
+    
+    def _refresh_log_colors(self):
+        """Refresh all log messages with new theme colors"""
+        if not hasattr(self, 'log_text'):
+            return
+        
+        self._redisplay_log_messages()
+
+    def _redisplay_log_messages(self):
+        """Re-display all log messages from history"""
+        # Build the whole document in memory and hand it to the widget in one
+        # setHtml() call instead of re-laying-out after every append()
+        lines = [
+            self._format_log_line(timestamp, message, level)
+            for timestamp, message, level in self.log_history
+        ]
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            self.log_text.setHtml("<br>".join(lines))
+        finally:
+            self.log_text.setUpdatesEnabled(True)
+    
+    def confirm_exit(self):
+        """Confirm exit with dialog"""
+        reply = self._confirm(
+            "Exit Mini Tools",
+            "Are you sure you want to exit?"
+        )
+        
+        if reply:
+            self.close()
+
+    def closeEvent(self, event):
+        """Shut the info worker down cleanly on exit"""
+        if self.info_worker.isRunning():
+            self.info_worker.stop()
+            self.info_worker.wait(2000)
+        event.accept()
+
+    def show_about(self):
+        """Show about information"""
+        about_text = f"""
+MiniTools<br>
+Version: {__version__}<br>
+<br>
+Dependencies:<br>
+- Python 3.6+<br>
+- PyQt6<br>
+<br>
+Author: {__author__}<br>
+<br>
+License: GNU General Public License v3.0 (GPL-3.0)<br>
+<br>
+This program is free software: you can redistribute it and/or modify<br>
+it under the terms of the GNU General Public License as published by<br>
+the Free Software Foundation, either version 3 of the License, or<br>
+(at your option) any later version.<br>
+<br>
+This program is distributed in the hope that it will be useful,<br>
+but WITHOUT ANY WARRANTY; without even the implied warranty of<br>
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the<br>
+GNU General Public License for more details.<br>
+<br>
+You should have received a copy of the GNU General Public License<br>
+along with this program.  If not, see &lt;<a href="https://www.gnu.org/licenses/">https://www.gnu.org/licenses/</a>&gt;.
+"""
+        
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle("About MiniTools")
+        msg_box.setTextFormat(Qt.TextFormat.RichText)
+        msg_box.setText(about_text)
+        msg_box.setInformativeText(
+            'Repository: <a href="https://github.com/Perrolito/MiniTools.py">https://github.com/Perrolito/MiniTools.py</a>'
+        )
+        msg_box.exec()
+    
+    def change_partition_uuid(self):
+        """Change partition UUID"""
+        if _IS_WINDOWS:
+            with self._log_batch():
+                self.log("\n" + "="*80, LogLevel.INFO)
+                self.log("Change Partition UUID - Not Available on Windows", LogLevel.WARNING)
+                self.log("="*80 + "\n", LogLevel.INFO)
+                self.log("This feature is not available on Windows.\n", LogLevel.INFO)
+                self.log("On Windows, you can use diskpart to manage disk IDs:\n", LogLevel.INFO)
+                self.log("1. Open Command Prompt as Administrator\n", LogLevel.INFO)
+                self.log("2. Run: diskpart\n", LogLevel.INFO)
+                self.log("3. Run: list disk\n", LogLevel.INFO)
+                self.log("4. Run: select disk X (replace X with disk number)\n", LogLevel.INFO)
+                self.log("5. Run: list partition\n", LogLevel.INFO)
+                self.log("6. Run: select partition Y (replace Y with partition number)\n", LogLevel.INFO)
+                self.log("7. Run: uniqueid disk\n", LogLevel.INFO)
+            return
+        
+        self.log("\n" + "="*80, LogLevel.INFO)
+        self.log("Change Partition UUID", LogLevel.WARNING)
+        self.log("="*80 + "\n", LogLevel.INFO)
+        
+        # Get partition device
+        partition_device, ok = self._prompt_text(
+            "Change Partition UUID",
+            "Enter partition device (e.g., /dev/sda1):"
+        )
+        
+        if not ok or not partition_device:
+            self.log("Operation cancelled.\n", LogLevel.INFO)
+            return
+        
+        partition_device = partition_device.strip()
+        
+        # Validate partition device
+        if not partition_device.startswith("/dev/"):
+            self.log(f"Error: Invalid partition device '{partition_device}'. Must start with /dev/\n", LogLevel.ERROR)
+            return
+        
+        self.log(f"Partition device: {partition_device}", LogLevel.INFO)
+
+        # Probe the partition once with a full blkid query - the TYPE field
+        # and the "Current info" line both come out of the same output, so
+        # only one polkit round-trip is paid up front. Everything from here
+        # is a chain of QProcess continuations.
+        self.log("Detecting partition filesystem type...", LogLevel.INFO)
+        self._run_capture(
+            "pkexec", ["blkid", partition_device],
+            lambda rc, out, err: self._uuid_on_probed(partition_device, rc, out, err)
+        )
+
+    def _uuid_on_probed(self, partition_device, returncode, stdout, stderr):
+        """Continue the UUID change once the single pre-op probe finishes"""
+        blkid_info = stdout.strip()
+        match = _BLKID_TYPE_RE.search(blkid_info)
+        filesystem = match.group(1) if match else ""
+
+        with self._log_batch():
+            self.log(f"blkid return code: {returncode}", LogLevel.INFO)
+            self.log(f"blkid detected type: '{filesystem}'", LogLevel.INFO)
+            if stderr.strip():
+                self.log(f"blkid stderr: {stderr.strip()}", LogLevel.WARNING)
+
+            if not filesystem:
+                self.log(f"Error: Could not detect filesystem type for {partition_device}\n", LogLevel.ERROR)
+                self.log("Possible reasons:", LogLevel.INFO)
+                self.log("  - Device does not exist", LogLevel.INFO)
+                self.log("  - Device is not a partition (may be a disk itself)", LogLevel.INFO)
+                self.log("  - Device has no filesystem (not formatted)", LogLevel.INFO)
+                self.log("  - Device is not accessible (permissions)\n", LogLevel.INFO)
+                return
+
+            self.log(f"Detected filesystem: {filesystem}\n", LogLevel.SUCCESS)
+
+            # Show partition information
+            self.log("Partition Information:", LogLevel.INFO)
+            self.log(f"  Device: {partition_device}", LogLevel.INFO)
+            self.log(f"  Filesystem: {filesystem}", LogLevel.INFO)
+            self.log(f"  Current info: {blkid_info}", LogLevel.INFO)
+            self.log("")
+
+        # Generate new UUID
+        new_uuid = str(uuid.uuid4())
+        self.log(f"Generated new UUID: {new_uuid}\n", LogLevel.WARNING)
+        
+        # Show confirmation dialog with details
+        confirmation_text = f"""
+Are you sure you want to change the UUID for this partition?
+
+Partition Device: {partition_device}
+Filesystem: {filesystem}
+New UUID: {new_uuid}
+
+This operation will modify the partition's UUID.
+This may affect boot configuration and fstab entries.
+
+Please verify the information above is correct.
+"""
+        
+        reply = self._confirm(
+            "Confirm UUID Change",
+            confirmation_text
+        )
+        
+        if not reply:
+            self.log("Operation cancelled by user.\n", LogLevel.INFO)
+            return
+        
+        self.log("Changing partition UUID...", LogLevel.WARNING)
+        
+        # Execute UUID change command
+        try:
+            if filesystem in ["ext2", "ext3", "ext4"]:
+                command = ["pkexec", "tune2fs", "-U", new_uuid, partition_device]
+            elif filesystem in ["xfs"]:
+                command = ["pkexec", "xfs_admin", "-U", new_uuid, partition_device]
+            elif filesystem in ["btrfs"]:
+                command = ["pkexec", "btrfstune", "-u", new_uuid, partition_device]
+            elif filesystem in ["vfat", "fat32"]:
+                self.log("Warning: FAT32 filesystem does not support UUID change directly.\n", LogLevel.WARNING)
+                self.log("You may need to reformat the partition.\n", LogLevel.WARNING)
+                return
+            elif filesystem in ["swap"]:
+                command = ["pkexec", "mkswap", "-U", new_uuid, partition_device]
+            else:
+                self.log(f"Error: Unsupported filesystem '{filesystem}' for UUID change\n", LogLevel.ERROR)
+                self.log("Supported filesystems: ext2, ext3, ext4, xfs, btrfs, swap\n", LogLevel.INFO)
+                return
+            
+            cmdline = shlex.join(command)
+            self.log("Executing command: %s\n", LogLevel.INFO, cmdline)
+
+            self._run_streamed(
+                command,
+                lambda rc: self._uuid_on_change_done(partition_device, rc)
+            )
+
+        except Exception as e:
+            self.log(f"\n✗ Error during UUID change: {str(e)}\n", LogLevel.ERROR)
+
+    def _uuid_on_change_done(self, partition_device, return_code):
+        """Report the outcome of the UUID change and probe the new info"""
+        if return_code == 0:
+            self.log("\n✓ Partition UUID changed successfully!\n", LogLevel.SUCCESS)
+
+            # Show new partition info
+            self._run_capture(
+                "pkexec", ["blkid", partition_device],
+                lambda rc, out, err: self._uuid_on_new_info(out)
+            )
+        else:
+            self.log(f"\n✗ Failed to change partition UUID. Error code: {return_code}\n", LogLevel.ERROR)
+
+    def _uuid_on_new_info(self, blkid_output):
+        """Log the post-change partition info and follow-up reminders"""
+        with self._log_batch():
+            self.log("New partition info:", LogLevel.INFO)
+            self.log(f"  {blkid_output.strip()}\n", LogLevel.INFO)
+
+            self.log("Note: If this is a boot partition, you may need to update:", LogLevel.WARNING)
+            self.log("  - /etc/fstab entries", LogLevel.WARNING)
+            self.log("  - GRUB configuration (run: sudo update-grub)", LogLevel.WARNING)
+            self.log("  - Bootloader configuration\n", LogLevel.WARNING)
+    
+    def execute_extension_script(self, script_path, script_name):
+        """Execute extension script"""
+        self.log("\n" + "="*80, LogLevel.INFO)
+        self.log(f"Execute Extension: {script_name}", LogLevel.WARNING)
+        self.log("="*80 + "\n", LogLevel.INFO)
+        
+        # Show confirmation dialog
+        reply = self._confirm(
+            "Execute Extension Script",
+            f"Are you sure you want to execute this extension script?\n\nScript: {script_name}\nPath: {script_path}\n\nThis script will run with your user permissions."
+        )
+        
+        if not reply:
+            self.log("Operation cancelled.\n", LogLevel.INFO)
+            return
+        
+        self.log(f"Executing: {script_path}\n", LogLevel.WARNING)
+        
+        try:
+            # Determine how to run the script
+            if script_path.endswith('.sh'):
+                command = ["bash", script_path]
+            elif script_path.endswith('.py'):
+                command = [sys.executable, script_path]
+            else:
+                self.log(f"Error: Unsupported script type\n", LogLevel.ERROR)
+                return
+            
+            def on_finished(return_code):
+                if return_code == 0:
+                    self.log(f"\n✓ Extension script executed successfully!\n", LogLevel.SUCCESS)
+                else:
+                    self.log(f"\n✗ Extension script failed with exit code: {return_code}\n", LogLevel.ERROR)
+
+            # Drained through the event loop - no reader thread, no blocking
+            # wait, and the window stays responsive while the script runs
+            self._run_streamed(command, on_finished)
+
+        except Exception as e:
+            self.log(f"\n✗ Error executing extension script: {str(e)}\n", LogLevel.ERROR)
+    
+    def show_extensions_info(self):
+        """Show extensions information"""
+        self.log("\n" + "="*80, LogLevel.INFO)
+        self.log("Extensions Directory", LogLevel.INFO)
+        self.log("="*80 + "\n", LogLevel.INFO)
+        
+        with self._log_batch():
+            self.log(f"Extensions path: {self.extensions_dir}", LogLevel.INFO)
+            self.log("", LogLevel.INFO)
+
+            if not os.path.exists(self.extensions_dir):
+                self.log("Directory does not exist.", LogLevel.WARNING)
+                if _IS_WINDOWS:
+                    self.log(f"Create it in File Explorer: {self.extensions_dir}", LogLevel.INFO)
+                else:
+                    self.log(f"Create it with: mkdir -p {self.extensions_dir}", LogLevel.INFO)
+            else:
+                self.log("Directory exists.", LogLevel.SUCCESS)
+
+            self.log("", LogLevel.INFO)
+            self.log("How to add extensions:", LogLevel.INFO)
+            self.log("1. Place .sh (shell) or .py (Python) scripts in the extensions directory", LogLevel.INFO)
+            self.log("2. Restart MiniTools to see your extensions", LogLevel.INFO)
+            self.log("3. Click an extension button to execute it", LogLevel.INFO)
+            self.log("", LogLevel.INFO)
+            self.log("Supported file types:", LogLevel.INFO)
+            self.log("  - .sh - Shell scripts (executed with bash)", LogLevel.INFO)
+            self.log("  - .py - Python scripts (executed with python3)", LogLevel.INFO)
+            self.log("", LogLevel.INFO)
+            self.log("Scripts will be executed with your user permissions.\n", LogLevel.WARNING)
+    
+    def zoom_in_log(self):
+        """Increase log font size"""
+        if not hasattr(self, 'log_text'):
+            return
+        
+        new_size = min(self.log_font_size + 1, Config.MAX_LOG_FONT_SIZE)
+        if new_size != self.log_font_size:
+            self.log_font_size = new_size
+            if hasattr(self, 'font_size_label'):
+                self.font_size_label.setText(str(self.log_font_size))
+            self._update_zoom_buttons()
+            self._apply_log_font_size()
+
+    def zoom_out_log(self):
+        """Decrease log font size"""
+        if not hasattr(self, 'log_text'):
+            return
+        
+        new_size = max(self.log_font_size - 1, Config.MIN_LOG_FONT_SIZE)
+        if new_size != self.log_font_size:
+            self.log_font_size = new_size
+            if hasattr(self, 'font_size_label'):
+                self.font_size_label.setText(str(self.log_font_size))
+            self._update_zoom_buttons()
+            self._apply_log_font_size()
+
+    def _apply_log_font_size(self):
+        """Apply the current font size to the whole log document
+
+        Changing the widget font reflows the existing document in a single
+        layout pass - no clear() and no O(N) history replay per click, and
+        the scroll position survives.
+        """
+        if not hasattr(self, 'log_text'):
+            return
+
+        font = self.log_text.font()
+        font.setPointSize(self.log_font_size)
+        self.log_text.setFont(font)
+    
+    def _update_zoom_buttons(self):
+        """Update zoom button states"""
+        if not hasattr(self, 'log_text') or not hasattr(self, 'zoom_in_btn') or not hasattr(self, 'zoom_out_btn'):
+            return
+        
+        self.zoom_in_btn.setEnabled(self.log_font_size < Config.MAX_LOG_FONT_SIZE)
+        self.zoom_out_btn.setEnabled(self.log_font_size > Config.MIN_LOG_FONT_SIZE)
+    
+    def apply_theme(self):
+        """Apply current theme (dark or light)"""
+        self._active_colors = Config.DARK_COLORS if self.dark_mode else Config.LIGHT_COLORS
+        if self.dark_mode:
+            self._apply_dark_theme()
+        else:
+            self._apply_light_theme()
+    
+    def _apply_dark_theme(self):
+        """Apply modern dark theme"""
+        self._set_app_qss(_DARK_QSS)
+    
+    def _apply_light_theme(self):
+        """Apply modern light theme"""
+        self._set_app_qss(_LIGHT_QSS)
+
+    def _set_app_qss(self, sheet):
+        """Install an application stylesheet unless it is already active
+
+        setStyleSheet re-parses the multi-KB sheet and re-polishes every
+        widget even when handed the identical string, so redundant
+        applications are skipped by identity.
+        """
+        if getattr(self, '_app_qss_applied', None) is sheet:
+            return
+        self._app_qss_applied = sheet
+        QApplication.instance().setStyleSheet(sheet)
+
+    def _dialog_qss(self):
+        """Stylesheet for dialogs under the current theme"""
+        return _DARK_DIALOG_QSS if self.dark_mode else _LIGHT_DIALOG_QSS
+
+    def _confirm(self, title, text):
+        """Ask a themed Yes/No question, defaulting to No.
+
+        Replaces QMessageBox.question so the dialog selectors can live on
+        the dialog itself instead of the application-wide sheet.
+        """
+        box = QMessageBox(self)
+        box.setStyleSheet(self._dialog_qss())
+        box.setIcon(QMessageBox.Icon.Question)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        box.exec()
+        return box.clickedButton() is box.button(QMessageBox.StandardButton.Yes)
+
+    def _prompt_text(self, title, label):
+        """Ask for a line of text with a themed input dialog"""
+        dialog = QInputDialog(self)
+        dialog.setStyleSheet(self._dialog_qss())
+        dialog.setWindowTitle(title)
+        dialog.setLabelText(label)
+        dialog.setTextEchoMode(QLineEdit.EchoMode.Normal)
+        ok = bool(dialog.exec())
+        return dialog.textValue(), ok
+
+    def _pick_file(self, title, name_filter):
+        """Pick an existing file with a themed file dialog.
+
+        Returns the selected path, or an empty string when cancelled.
+        """
+        dialog = QFileDialog(self, title, self._home, name_filter)
+        dialog.setStyleSheet(self._dialog_qss())
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        if dialog.exec():
+            files = dialog.selectedFiles()
+            if files:
+                return files[0]
+        return ""
     
     def _update_right_scroll_style(self):
         """Update right scroll area styling based on current theme"""
         if hasattr(self, 'right_scroll'):
-            if self.dark_mode:
-                self.right_scroll.setStyleSheet("""
-                    QScrollArea {
-                        background-color: #1c1c1c;
-                        border: none;
-                    }
-                    QScrollBar:vertical {
-                        background-color: #1c1c1c;
-                        width: 12px;
-                        border-radius: 6px;
-                    }
-                    QScrollBar::handle:vertical {
-                        background-color: #3c3c3c;
-                        border-radius: 6px;
-                        min-height: 30px;
-                    }
-                    QScrollBar::handle:vertical:hover {
-                        background-color: #4a4a4a;
-                    }
-                    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                        height: 0px;
-                    }
-                    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                        background: none;
-                    }
-                """)
-            else:
-                self.right_scroll.setStyleSheet("""
-                    QScrollArea {
-                        background-color: #f5f5f5;
-                        border: none;
-                    }
-                    QScrollBar:vertical {
-                        background-color: #f5f5f5;
-                        width: 12px;
-                        border-radius: 6px;
-                    }
-                    QScrollBar::handle:vertical {
-                        background-color: #c0c0c0;
-                        border-radius: 6px;
-                        min-height: 30px;
-                    }
-                    QScrollBar::handle:vertical:hover {
-                        background-color: #a0a0a0;
-                    }
-                    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                        height: 0px;
-                    }
-                    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                        background: none;
-                    }
-                """)
+            sheet = _RIGHT_SCROLL_DARK_QSS if self.dark_mode else _RIGHT_SCROLL_LIGHT_QSS
+            # setStyleSheet forces a full re-polish even when the sheet
+            # is unchanged, so skip the redundant calls
+            if getattr(self, '_right_scroll_last_sheet', None) is sheet:
+                return
+            self._right_scroll_last_sheet = sheet
+            self.right_scroll.setStyleSheet(sheet)
     
     def create_ui(self):
         """Create the modern user interface"""
+        # Suppress paints while the widget tree is assembled so the
+        # window composites once at the end instead of flickering through
+        # partial layouts
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _build_ui(self):
+        """Assemble the widget tree (paints suppressed by create_ui)"""
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
         main_layout = QVBoxLayout(central_widget)
-        main_layout.setSpacing(0)
-        main_layout.setContentsMargins(0, 0, 0, 0)
+        _configure_layout(main_layout, 0, 0)
         
-        screen = self.screen().availableGeometry()
+        screen = self._screen_geom
         screen_width = screen.width()
         
         if screen_width < 1024:
@@ -3018,8 +3681,7 @@ Please verify the information above is correct.
             right_panel_min = 360
             right_panel_max = 420
         
-        content_layout.setSpacing(content_spacing)
-        content_layout.setContentsMargins(content_margin, content_margin, content_margin, content_margin)
+        _configure_layout(content_layout, content_spacing, content_margin)
         
         left_panel = self.create_info_section()
         content_layout.addWidget(left_panel, stretch=2)
@@ -3041,10 +3703,23 @@ Please verify the information above is correct.
         content_layout.addWidget(right_scroll, stretch=1)
         
         main_layout.addWidget(content_widget, stretch=1)
-    
+
+        # Warm up the dialog classes: polishing a throwaway instance of
+        # each makes Qt run its QSS selector matching now, so the first
+        # real confirmation box does not pay a visible first-show stall
+        QTimer.singleShot(0, self._prepolish_dialogs)
+
+    def _prepolish_dialogs(self):
+        """Force QSS polishing of the dialog types before first use"""
+        for dialog_cls in (QMessageBox, QInputDialog, QFileDialog):
+            widget = dialog_cls(self)
+            widget.setStyleSheet(self._dialog_qss())
+            widget.ensurePolished()
+            widget.deleteLater()
+
     def create_info_section(self):
         """Create the information display section"""
-        screen = self.screen().availableGeometry()
+        screen = self._screen_geom
         screen_width = screen.width()
         
         if screen_width < 1024:
@@ -3060,8 +3735,7 @@ Please verify the information above is correct.
         card = QFrame()
         card.setObjectName("infoCard")
         card_layout = QVBoxLayout(card)
-        card_layout.setSpacing(card_spacing)
-        card_layout.setContentsMargins(card_margin, card_margin, card_margin, card_margin)
+        _configure_layout(card_layout, card_spacing, card_margin)
         
         header = QHBoxLayout()
         header.setContentsMargins(0, 0, 0, 0)
@@ -3074,15 +3748,13 @@ Please verify the information above is correct.
         log_section = QFrame()
         log_section.setObjectName("logSection")
         log_layout = QVBoxLayout(log_section)
-        log_layout.setSpacing(12)
-        log_layout.setContentsMargins(0, 0, 0, 0)
+        _configure_layout(log_layout, 12, 0)
         
         # Zoom toolbar
         zoom_toolbar = QFrame()
         zoom_toolbar.setObjectName("zoomToolbar")
         zoom_layout = QHBoxLayout(zoom_toolbar)
-        zoom_layout.setContentsMargins(0, 0, 0, 0)
-        zoom_layout.setSpacing(8)
+        _configure_layout(zoom_layout, 8, 0)
         zoom_layout.addStretch()
         
         # Zoom out button
@@ -3112,9 +3784,13 @@ Please verify the information above is correct.
         self.log_text = QTextBrowser()
         self.log_text.setObjectName("logText")
         self.log_text.setReadOnly(True)
+        # The log is append-only; skipping the undo stack keeps bulk
+        # subprocess output from accumulating edit records
+        self.log_text.setUndoRedoEnabled(False)
         self.log_text.setFont(QFont(Config.LOG_FONT_FAMILY, self.log_font_size))
+        self.log_text.document().setMaximumBlockCount(Config.MAX_LOG_LINES)
         self.log_text.setOpenExternalLinks(True)  # 允许点击链接在外部浏览器打开
-        screen = self.screen().availableGeometry()
+        screen = self._screen_geom
         if screen.height() < 768:
             self.log_text.setMinimumHeight(150)
         else:
@@ -3127,7 +3803,7 @@ Please verify the information above is correct.
     
     def create_button_sections(self):
         """Create button sections for system information"""
-        screen = self.screen().availableGeometry()
+        screen = self._screen_geom
         screen_width = screen.width()
         
         if screen_width < 1024:
@@ -3139,132 +3815,55 @@ Please verify the information above is correct.
         
         container = QWidget()
         container_layout = QVBoxLayout(container)
-        container_layout.setSpacing(container_spacing)
-        container_layout.setContentsMargins(0, 0, 0, 0)
+        _configure_layout(container_layout, container_spacing, 0)
         
         # System Info Group
-        system_group = self.create_button_group(
-            "System Information",
-            [
-                ("System Overview", self._auto_run_fetch_tool, "Show system overview using fastfetch/neofetch"),
-                ("CPU Info", self.show_cpu_info, "Show processor details and usage"),
-                ("Memory Info", self.show_memory_info, "Show RAM usage and statistics"),
-                ("Swap Info", self.show_swap_info, "Show swap space usage"),
-                ("Kernel Info", self.show_kernel_info, "Show kernel version and system details"),
-                ("Disk Info", self.show_disk_info, "Show disk usage and mounts"),
-            ]
-        )
-        container_layout.addWidget(system_group)
-        
-        # Maintenance Group
-        maintenance_buttons = [
-            ("Check System Updates", self.show_update_info, "Check for available system package updates"),
-            ("Install Package from File", self.install_package_from_file, "Install package from file"),
-        ]
-        
-        # Add Flatpak-related buttons only on Linux
-        if not PlatformHelper.is_windows():
-            maintenance_buttons.extend([
-                ("Check Flatpak Updates", self.show_flatpak_update_info, "Check for available Flatpak updates"),
-                ("Remove Unused Flatpak Runtimes", self.remove_unused_flatpak, "Remove unused Flatpak runtimes to free space"),
-            ])
-        
-        maintenance_group = self.create_button_group(
-            "System Maintenance",
-            maintenance_buttons
-        )
-        container_layout.addWidget(maintenance_group)
-        
+        container_layout.addWidget(self._group_from_specs("System Information", _SYSTEM_INFO_SPECS))
+
+        # Maintenance Group (Flatpak entries present only on Linux)
+        container_layout.addWidget(self._group_from_specs("System Maintenance", _MAINTENANCE_SPECS))
+
         # Disk Operations Group
-        if not PlatformHelper.is_windows():
-            disk_group = self.create_button_group(
-                "Disk Operations",
-                [
-                    ("Change Partition UUID", self.change_partition_uuid, "Generate and change partition UUID"),
-                ]
-            )
-            container_layout.addWidget(disk_group)
+        if _DISK_SPECS:
+            container_layout.addWidget(self._group_from_specs("Disk Operations", _DISK_SPECS))
         
-        # Extensions Group (dynamic)
+        # Extensions Group (dynamic) - the directory scan is file I/O, so
+        # a placeholder holds the slot and the real group is built by a
+        # zero-delay timer after the first paint
         self.extensions_dir = Config.get_extensions_dir()
         self.extension_scripts = []
-        
-        if os.path.exists(self.extensions_dir):
-            try:
-                for item in sorted(os.listdir(self.extensions_dir)):
-                    item_path = os.path.join(self.extensions_dir, item)
-                    if os.path.isfile(item_path) and any(item.endswith(ext) for ext in Config.SUPPORTED_SCRIPT_EXTENSIONS):
-                        script_name = item  # Keep the full filename including extension
-                        self.extension_scripts.append((script_name, item_path))
-            except Exception as e:
-                self.log(f"Error scanning extensions directory: {str(e)}", LogLevel.WARNING)
-        
-        if self.extension_scripts:
-            extension_buttons = []
-            for script_name, script_path in self.extension_scripts:
-                # Create a callback with the script path using a wrapper function to avoid closure issues
-                def make_callback(p, n):
-                    return lambda: self.execute_extension_script(p, n)
-                callback = make_callback(script_path, script_name)
-                extension_buttons.append((script_name, callback, f"Execute {script_name} extension"))
-            
-            # Add guide button at the end
-            extension_buttons.append(("Add more extensions", self.show_extensions_info, "Show how to add extension scripts"))
-            
-            extensions_group = self.create_button_group(
-                "Extensions",
-                extension_buttons
-            )
-            container_layout.addWidget(extensions_group)
-        else:
-            # Show empty extensions group with instructions
-            extensions_group = self.create_button_group(
-                "Extensions",
-                [
-                    ("No extensions found", self.show_extensions_info, f"Add .sh or .py scripts to {self.extensions_dir}"),
-                ]
-            )
-            container_layout.addWidget(extensions_group)
-        
-        # iFlow CLI Group
-        iflow_group = self.create_button_group(
-            "iFlow CLI",
-            [
-                ("Install iFlow CLI", self.install_iflow_cli, "Install iFlow CLI from official repository"),
-                ("Clear iFlow History", self.clear_iflow_history, "Clear iFlow CLI command history"),
-            ]
-        )
-        
-        # Only show iFlow CLI group if not on Windows (or show with Windows instructions)
-        if not PlatformHelper.is_windows():
-            container_layout.addWidget(iflow_group)
-        else:
-            # On Windows, show iFlow CLI with installation instructions
-            iflow_group_windows = self.create_button_group(
-                "iFlow CLI",
-                [
-                    ("Install iFlow CLI", self.install_iflow_cli, "Show iFlow CLI installation instructions for Windows"),
-                    ("Clear iFlow History", self.clear_iflow_history, "Show iFlow CLI history location on Windows"),
-                ]
-            )
-            container_layout.addWidget(iflow_group_windows)
-        
+        self._container_layout = container_layout
+        self._extensions_group = QWidget()
+        container_layout.addWidget(self._extensions_group)
+        QTimer.singleShot(0, self._populate_extensions)
+
+        # Rebuild the group only when the directory actually changes,
+        # instead of ever rescanning on UI rebuilds
+        self._ext_watcher = QFileSystemWatcher(self)
+        if os.path.isdir(self.extensions_dir):
+            self._ext_watcher.addPath(self.extensions_dir)
+        self._ext_watcher.directoryChanged.connect(self._populate_extensions)
+        
+        # iFlow CLI Group - the spec carries the Windows-specific tooltips
+        container_layout.addWidget(self._group_from_specs("iFlow CLI", _IFLOW_SPECS))
+
         # About Group
-        about_group = self.create_button_group(
-            "About",
-            [
-                ("About MiniTools", self.show_about, "Show program information"),
-            ]
-        )
-        container_layout.addWidget(about_group)
+        container_layout.addWidget(self._group_from_specs("About", _ABOUT_SPECS))
         
         container_layout.addStretch()
         
         return container
     
+    def _group_from_specs(self, title, specs):
+        """Materialize a button group from import-time ButtonSpec entries"""
+        return self.create_button_group(
+            title,
+            [(spec.text, getattr(self, spec.method), spec.tip) for spec in specs]
+        )
+
     def create_button_group(self, title, buttons):
         """Create a button group with title and buttons"""
-        screen = self.screen().availableGeometry()
+        screen = self._screen_geom
         screen_width = screen.width()
         
         if screen_width < 1024:
@@ -3280,8 +3879,7 @@ Please verify the information above is correct.
         card = QFrame()
         card.setObjectName("buttonCard")
         card_layout = QVBoxLayout(card)
-        card_layout.setSpacing(card_spacing)
-        card_layout.setContentsMargins(card_margin, card_margin, card_margin, card_margin)
+        _configure_layout(card_layout, card_spacing, card_margin)
         
         header = QHBoxLayout()
         header.setContentsMargins(0, 0, 0, 0)
@@ -3299,63 +3897,93 @@ Please verify the information above is correct.
             card_layout.addWidget(btn)
         
         return card
-    
+
+    def _scan_extension_scripts(self):
+        """Enumerate extension scripts in the extensions directory"""
+        scripts = []
+        try:
+            # scandir reuses the file type the directory entry already
+            # carries, avoiding a stat call per item
+            with os.scandir(self.extensions_dir) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.name.endswith(Config.SUPPORTED_SCRIPT_EXTENSIONS) and entry.is_file():
+                        # Keep the full filename including extension
+                        scripts.append((entry.name, entry.path))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.log(f"Error scanning extensions directory: {str(e)}", LogLevel.WARNING)
+        return scripts
+
+    def _populate_extensions(self):
+        """Build the Extensions group and swap it into its placeholder slot"""
+        self.extension_scripts = self._scan_extension_scripts()
+
+        if self.extension_scripts:
+            extension_buttons = []
+            for script_name, script_path in self.extension_scripts:
+                # partial binds the script arguments without allocating a
+                # nested function and closure per button
+                callback = functools.partial(self.execute_extension_script, script_path, script_name)
+                extension_buttons.append((script_name, callback, f"Execute {script_name} extension"))
+
+            # Add guide button at the end
+            extension_buttons.append(("Add more extensions", self.show_extensions_info, "Show how to add extension scripts"))
+        else:
+            # Show empty extensions group with instructions
+            extension_buttons = [
+                ("No extensions found", self.show_extensions_info, f"Add .sh or .py scripts to {self.extensions_dir}"),
+            ]
+
+        extensions_group = self.create_button_group("Extensions", extension_buttons)
+        self._container_layout.replaceWidget(self._extensions_group, extensions_group)
+        self._extensions_group.deleteLater()
+        self._extensions_group = extensions_group
+
     def show_cpu_info(self):
         """Show CPU information"""
         self.log("Fetching CPU information...", LogLevel.INFO)
-        self.info_worker = SystemInfoWorker("cpu")
-        self.info_worker.data_ready.connect(self._display_info)
-        self.info_worker.error_signal.connect(self._display_error)
-        self.info_worker.start()
-    
+        self.info_worker.request("cpu")
+
     def show_memory_info(self):
         """Show memory information"""
         self.log("Fetching memory information...", LogLevel.INFO)
-        self.info_worker = SystemInfoWorker("memory")
-        self.info_worker.data_ready.connect(self._display_info)
-        self.info_worker.error_signal.connect(self._display_error)
-        self.info_worker.start()
-    
+        self.info_worker.request("memory")
+
     def show_kernel_info(self):
         """Show kernel information"""
         self.log("Fetching kernel information...", LogLevel.INFO)
-        self.info_worker = SystemInfoWorker("kernel")
-        self.info_worker.data_ready.connect(self._display_info)
-        self.info_worker.error_signal.connect(self._display_error)
-        self.info_worker.start()
-    
+        self.info_worker.request("kernel")
+
     def show_swap_info(self):
         """Show swap information"""
         self.log("Fetching swap information...", LogLevel.INFO)
-        self.info_worker = SystemInfoWorker("swap")
-        self.info_worker.data_ready.connect(self._display_info)
-        self.info_worker.error_signal.connect(self._display_error)
-        self.info_worker.start()
-    
+        self.info_worker.request("swap")
+
     def show_disk_info(self):
         """Show disk information"""
         self.log("Fetching disk information...", LogLevel.INFO)
-        self.info_worker = SystemInfoWorker("disk")
-        self.info_worker.data_ready.connect(self._display_info)
-        self.info_worker.error_signal.connect(self._display_error)
-        self.info_worker.start()
-    
+        self.info_worker.request("disk")
+
     def show_update_info(self):
         """Show update information"""
         self.log("Checking for software updates...", LogLevel.INFO)
-        self.info_worker = SystemInfoWorker("update")
-        self.info_worker.data_ready.connect(self._display_info_with_update_option)
-        self.info_worker.error_signal.connect(self._display_error)
-        self.info_worker.start()
-    
+        self.info_worker.request("update")
+
     def show_flatpak_update_info(self):
         """Show Flatpak update information"""
         self.log("Checking for Flatpak updates...", LogLevel.INFO)
-        self.info_worker = SystemInfoWorker("flatpak")
-        self.info_worker.data_ready.connect(self._display_info_with_flatpak_update_option)
-        self.info_worker.error_signal.connect(self._display_error)
-        self.info_worker.start()
-    
+        self.info_worker.request("flatpak")
+
+    def _route_info(self, title, content):
+        """Route worker results to the right display slot based on the title"""
+        if title == "System Updates":
+            self._display_info_with_update_option(title, content)
+        elif title == "Flatpak Updates":
+            self._display_info_with_flatpak_update_option(title, content)
+        else:
+            self._display_info(title, content)
+
     def _display_info_with_update_option(self, title, content):
         """Display the information in the log with update option"""
         self._display_info(title, content)
@@ -3367,15 +3995,12 @@ Please verify the information above is correct.
             self.log("="*80 + "\n", LogLevel.INFO)
             
             # 显示确认对话框
-            reply = QMessageBox.question(
-                self,
+            reply = self._confirm(
                 "Execute System Update",
-                "System updates are available.\n\nDo you want to execute system update now?\n\nNote: This operation requires root privileges and may require password input.",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
+                "System updates are available.\n\nDo you want to execute system update now?\n\nNote: This operation requires root privileges and may require password input."
             )
             
-            if reply == QMessageBox.StandardButton.Yes:
+            if reply:
                 self.log("Executing system update...", LogLevel.WARNING)
                 self.execute_system_update()
             else:
@@ -3394,15 +4019,12 @@ Please verify the information above is correct.
             self.log("="*80 + "\n", LogLevel.INFO)
             
             # 显示确认对话框
-            reply = QMessageBox.question(
-                self,
+            reply = self._confirm(
                 "Execute Flatpak Update",
-                "Flatpak updates are available.\n\nDo you want to update Flatpak applications now?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
+                "Flatpak updates are available.\n\nDo you want to update Flatpak applications now?"
             )
             
-            if reply == QMessageBox.StandardButton.Yes:
+            if reply:
                 self.log("Executing Flatpak update...", LogLevel.WARNING)
                 self.execute_flatpak_update()
             else:
@@ -3414,48 +4036,26 @@ Please verify the information above is correct.
         """Execute Flatpak update"""
         command = ["flatpak", "update", "-y"]
         
-        self.log(f"Executing command: {' '.join(command)}", LogLevel.WARNING)
-        
-        try:
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            self.log("Starting Flatpak update, please wait...\n", LogLevel.INFO)
-            
-            def read_output():
-                while True:
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output:
-                        self.log(output.strip(), LogLevel.INFO)
-                        QApplication.processEvents()
-            
-            import threading
-            output_thread = threading.Thread(target=read_output)
-            output_thread.daemon = True
-            output_thread.start()
-            
-            return_code = process.wait()
-            output_thread.join(timeout=2)
-            
+        cmdline = shlex.join(command)
+        self.log(f"Executing command: {cmdline}", LogLevel.WARNING)
+
+        def on_finished(return_code):
             if return_code == 0:
                 self.log("\n✓ Flatpak update completed!\n", LogLevel.SUCCESS)
             else:
-                self.log(f"\n✗ Flatpak update failed, error code: {return_code}\n", "error")
-                    
+                self.log(f"\n✗ Flatpak update failed, error code: {return_code}\n", LogLevel.ERROR)
+
+        try:
+            self.log("Starting Flatpak update, please wait...\n", LogLevel.INFO)
+            # Drained through the event loop - no reader thread, no blocking
+            # wait, and the window stays responsive while flatpak runs
+            self._run_streamed(command, on_finished)
         except Exception as e:
             self.log(f"\n✗ Error during Flatpak update: {str(e)}\n", LogLevel.ERROR)
     
     def remove_unused_flatpak(self):
         """Remove unused Flatpak runtimes"""
-        if PlatformHelper.is_windows():
+        if _IS_WINDOWS:
             self.log("\n" + "="*80, LogLevel.INFO)
             self.log("Flatpak not supported on Windows", LogLevel.WARNING)
             self.log("="*80 + "\n", LogLevel.INFO)
@@ -3467,56 +4067,29 @@ Please verify the information above is correct.
         self.log("="*80 + "\n", LogLevel.INFO)
         
         # 显示确认对话框
-        reply = QMessageBox.question(
-            self,
+        reply = self._confirm(
             "Remove Unused Flatpak Runtimes",
-            "This will remove unused Flatpak runtimes to free disk space.\n\nDo you want to continue?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+            "This will remove unused Flatpak runtimes to free disk space.\n\nDo you want to continue?"
         )
         
-        if reply != QMessageBox.StandardButton.Yes:
+        if not reply:
             self.log("Operation cancelled.\n", LogLevel.INFO)
             return
         
         command = ["flatpak", "uninstall", "--unused", "-y"]
         
-        self.log(f"Executing command: {' '.join(command)}", LogLevel.WARNING)
+        cmdline = shlex.join(command)
+        self.log(f"Executing command: {cmdline}", LogLevel.WARNING)
         
-        try:
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            self.log("Removing unused runtimes, please wait...\n", LogLevel.INFO)
-            
-            def read_output():
-                while True:
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output:
-                        self.log(output.strip(), LogLevel.INFO)
-                        QApplication.processEvents()
-            
-            import threading
-            output_thread = threading.Thread(target=read_output)
-            output_thread.daemon = True
-            output_thread.start()
-            
-            return_code = process.wait()
-            output_thread.join(timeout=2)
-            
+        def on_finished(return_code):
             if return_code == 0:
                 self.log("\n✓ Unused Flatpak runtimes removed successfully!\n", LogLevel.SUCCESS)
             else:
-                self.log(f"\n✗ Operation failed, error code: {return_code}\n", "error")
-                    
+                self.log(f"\n✗ Operation failed, error code: {return_code}\n", LogLevel.ERROR)
+
+        try:
+            self.log("Removing unused runtimes, please wait...\n", LogLevel.INFO)
+            self._run_streamed(command, on_finished)
         except Exception as e:
             self.log(f"\n✗ Error during operation: {str(e)}\n", LogLevel.ERROR)
     
@@ -3526,12 +4099,10 @@ Please verify the information above is correct.
         self.log("Install Package from File", LogLevel.WARNING)
         self.log("="*80 + "\n", LogLevel.INFO)
         
-        if PlatformHelper.is_windows():
+        if _IS_WINDOWS:
             # Windows: support .exe and .msi
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
+            file_path = self._pick_file(
                 "Select Package File",
-                str(Path.home()),
                 "Package Files (*.exe *.msi);;All Files (*)"
             )
             
@@ -3541,12 +4112,11 @@ Please verify the information above is correct.
             
             self.log(f"Selected file: {file_path}\n", LogLevel.INFO)
             
-            file_ext = Path(file_path).suffix.lower()
+            file_ext = os.path.splitext(file_path)[1].lower()
             
             if file_ext == '.exe':
                 self.log(f"Running installer: {file_path}\n", LogLevel.WARNING)
                 try:
-                    import subprocess
                     subprocess.Popen([file_path], shell=True)
                     self.log("✓ Installer started successfully.\n", LogLevel.SUCCESS)
                 except Exception as e:
@@ -3564,10 +4134,8 @@ Please verify the information above is correct.
             return
         
         # Linux/macOS: support .deb, .rpm, .pkg.tar.xz
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
+        file_path = self._pick_file(
             "Select Package File",
-            str(Path.home()),
             "Package Files (*.deb *.rpm *.pkg.tar.xz *.pkg.tar.zst);;All Files (*)"
         )
         
@@ -3578,62 +4146,57 @@ Please verify the information above is correct.
         self.log(f"Selected file: {file_path}\n", LogLevel.INFO)
         
         # 检测包类型并构建安装命令
-        file_ext = Path(file_path).suffix.lower()
+        file_ext = os.path.splitext(file_path)[1].lower()
         distro = self._detect_distro()
-        
+
         command = []
-        
+
         if file_ext == '.deb':
-            if distro in ["ubuntu", "debian", "mint", "pop", "zorin", "elementary"]:
-                command = ["pkexec", "dpkg", "-i", file_path]
-                command_fix = ["pkexec", "apt-get", "install", "-f"]
+            if distro in _DEB_DISTROS:
+                # One elevated sh -c runs the install and the dependency
+                # fix together: one polkit prompt instead of two, one
+                # streamed pipe. ';' (not '&&') so the -f fix still runs
+                # when dpkg exits nonzero over missing dependencies.
+                command = ["pkexec", "sh", "-c",
+                           f"dpkg -i {shlex.quote(file_path)}; apt-get install -f -y"]
             else:
                 self.log(f"Warning: .deb packages are for Debian-based systems only.\n", LogLevel.WARNING)
-                reply = QMessageBox.question(
-                    self,
+                reply = self._confirm(
                     "Continue Anyway?",
-                    "This system is not Debian-based. Continue installation anyway?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No
+                    "This system is not Debian-based. Continue installation anyway?"
                 )
-                if reply == QMessageBox.StandardButton.Yes:
-                    command = ["pkexec", "dpkg", "-i", file_path]
-                    command_fix = ["pkexec", "apt-get", "install", "-f"]
+                if reply:
+                    command = ["pkexec", "sh", "-c",
+                           f"dpkg -i {shlex.quote(file_path)}; apt-get install -f -y"]
                 else:
                     self.log("Operation cancelled.\n", LogLevel.INFO)
                     return
         
         elif file_ext == '.rpm':
-            if distro in ["fedora", "nobara", "rhel", "centos", "almalinux", "rocky", "opensuse-leap", "opensuse-tumbleweed", "sle"]:
+            if distro in _RPM_DISTROS:
                 command = ["pkexec", "rpm", "-i", file_path]
             else:
                 self.log(f"Warning: .rpm packages are for RPM-based systems only.\n", LogLevel.WARNING)
-                reply = QMessageBox.question(
-                    self,
+                reply = self._confirm(
                     "Continue Anyway?",
-                    "This system is not RPM-based. Continue installation anyway?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No
+                    "This system is not RPM-based. Continue installation anyway?"
                 )
-                if reply == QMessageBox.StandardButton.Yes:
+                if reply:
                     command = ["pkexec", "rpm", "-i", file_path]
                 else:
                     self.log("Operation cancelled.\n", LogLevel.INFO)
                     return
         
         elif file_ext in ['.pkg.tar.xst', '.pkg.tar.xz']:
-            if distro in ["arch", "cachyos", "manjaro", "endeavouros", "xerolinux", "garuda"]:
+            if distro in _ARCH_DISTROS:
                 command = ["pkexec", "pacman", "-U", "--noconfirm", file_path]
             else:
                 self.log(f"Warning: Arch packages are for Arch-based systems only.\n", LogLevel.WARNING)
-                reply = QMessageBox.question(
-                    self,
+                reply = self._confirm(
                     "Continue Anyway?",
-                    "This system is not Arch-based. Continue installation anyway?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No
+                    "This system is not Arch-based. Continue installation anyway?"
                 )
-                if reply == QMessageBox.StandardButton.Yes:
+                if reply:
                     command = ["pkexec", "pacman", "-U", "--noconfirm", file_path]
                 else:
                     self.log("Operation cancelled.\n", LogLevel.INFO)
@@ -3649,88 +4212,30 @@ Please verify the information above is correct.
             return
         
         # 显示确认对话框
-        reply = QMessageBox.question(
-            self,
+        reply = self._confirm(
             "Install Package",
-            f"Install package: {Path(file_path).name}?\n\nThis operation requires root privileges.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+            f"Install package: {os.path.basename(file_path)}?\n\nThis operation requires root privileges."
         )
         
-        if reply != QMessageBox.StandardButton.Yes:
+        if not reply:
             self.log("Installation cancelled.\n", LogLevel.INFO)
             return
         
         # 执行安装
-        self.log(f"Executing: {' '.join(command)}\n", LogLevel.WARNING)
-        
-        try:
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            self.log("Installing package, please wait...\n", LogLevel.INFO)
-            
-            def read_output():
-                while True:
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output:
-                        self.log(output.strip(), LogLevel.INFO)
-                        QApplication.processEvents()
-            
-            import threading
-            output_thread = threading.Thread(target=read_output)
-            output_thread.daemon = True
-            output_thread.start()
-            
-            return_code = process.wait()
-            output_thread.join(timeout=2)
-            
+        cmdline = shlex.join(command)
+        self.log(f"Executing: {cmdline}\n", LogLevel.WARNING)
+
+        def on_finished(return_code):
             if return_code == 0:
                 self.log("\n✓ Package installed successfully!\n", LogLevel.SUCCESS)
-                
-                # 如果是deb包，尝试修复依赖
-                if file_ext == '.deb' and 'command_fix' in locals():
-                    self.log("Checking and fixing dependencies...\n", LogLevel.INFO)
-                    process_fix = subprocess.Popen(
-                        command_fix,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        bufsize=1,
-                        universal_newlines=True
-                    )
-                    
-                    def read_fix_output():
-                        while True:
-                            output = process_fix.stdout.readline()
-                            if output == '' and process_fix.poll() is not None:
-                                break
-                            if output:
-                                self.log(output.strip(), LogLevel.INFO)
-                                QApplication.processEvents()
-                    
-                    fix_thread = threading.Thread(target=read_fix_output)
-                    fix_thread.daemon = True
-                    fix_thread.start()
-                    
-                    fix_return_code = process_fix.wait()
-                    fix_thread.join(timeout=2)
-                    
-                    if fix_return_code == 0:
-                        self.log("\n✓ Dependencies fixed successfully!\n", LogLevel.SUCCESS)
-                    else:
-                        self.log(f"\n⚠ Dependency check completed with warnings.\n", LogLevel.WARNING)
             else:
-                self.log(f"\n✗ Installation failed, error code: {return_code}\n", "error")
-                    
+                self.log(f"\n✗ Installation failed, error code: {return_code}\n", LogLevel.ERROR)
+
+        try:
+            self.log("Installing package, please wait...\n", LogLevel.INFO)
+            # Drained through the event loop - no reader thread and no
+            # blocking wait on the GUI thread
+            self._run_streamed(command, on_finished)
         except Exception as e:
             self.log(f"\n✗ Error during installation: {str(e)}\n", LogLevel.ERROR)
     
@@ -3739,117 +4244,75 @@ Please verify the information above is correct.
         distro = self._detect_distro()
         command = []
         
-        if PlatformHelper.is_windows():
+        if _IS_WINDOWS:
             self.log("Windows Updates must be run through Windows Update Settings.\n", LogLevel.INFO)
             self.log("Press Win + I to open Settings, then go to Windows Update.\n", LogLevel.INFO)
             return
-        elif PlatformHelper.is_macos():
+        elif _IS_MACOS:
             self.log("macOS updates must be run through System Settings > Software Update.\n", LogLevel.INFO)
             return
-        elif distro in ["ubuntu", "debian", "mint", "pop", "zorin", "elementary"]:
-            command = ["pkexec", "sh", "-c", "apt update && apt upgrade -y"]
-        elif distro in ["fedora", "nobara", "rhel", "centos", "almalinux", "rocky"]:
-            command = ["pkexec", "sh", "-c", "dnf upgrade -y"]
-        elif distro in ["arch", "cachyos", "manjaro", "endeavouros", "xerolinux", "garuda"]:
-            command = ["pkexec", "sh", "-c", "pacman -Syu --noconfirm"]
-        elif distro in ["opensuse-leap", "opensuse-tumbleweed", "sle"]:
-            command = ["pkexec", "sh", "-c", "zypper dup -y"]
-        else:
+        family = _distro_family(distro)
+        if family is None:
             self.log("不支持的发行版，请手动更新。", LogLevel.ERROR)
             return
+        command = _UPDATE_CMDS[family]
         
         # 启动更新进程
-        self.log(f"正在执行命令: {' '.join(command)}", LogLevel.WARNING)
+        cmdline = shlex.join(command)
+        self.log(f"正在执行命令: {cmdline}", LogLevel.WARNING)
         self.log("注意: 更新过程会在新的终端窗口中进行\n", LogLevel.INFO)
         
-        try:
-            # 使用QProcess来处理pkexec，并等待完成
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            # 实时读取输出
-            self.log("开始更新，请稍候...\n", LogLevel.INFO)
-            
-            # 创建一个线程来读取输出
-            def read_output():
-                while True:
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output:
-                        self.log(output.strip(), LogLevel.INFO)
-                        # 强制UI更新
-                        QApplication.processEvents()
-            
-            import threading
-            output_thread = threading.Thread(target=read_output)
-            output_thread.daemon = True
-            output_thread.start()
-            
-            # 等待进程完成
-            return_code = process.wait()
-            output_thread.join(timeout=2)
-            
+        def on_finished(return_code):
             if return_code == 0:
                 self.log("\n✓ 系统更新完成!\n", LogLevel.SUCCESS)
             else:
                 self.log(f"\n✗ 更新失败，错误码: {return_code}\n", LogLevel.ERROR)
-                    
+
+        try:
+            self.log("开始更新，请稍候...\n", LogLevel.INFO)
+            # Drained through the event loop - no reader thread, no
+            # blocking wait while pkexec runs
+            self._run_streamed(command, on_finished)
         except Exception as e:
             self.log(f"\n✗ 更新过程中出现错误: {str(e)}\n", LogLevel.ERROR)
     
     def _detect_distro(self):
         """Detect the Linux distribution"""
-        try:
-            with open("/etc/os-release", "r") as f:
-                content = f.read()
-            for line in content.split("\n"):
-                if line.startswith("ID="):
-                    distro = line.split("=", 1)[1].strip().strip('"').lower()
-                    if distro == "pika":
-                        distro = "pikaos"
-                    return distro
-        except (IOError, FileNotFoundError):
-            pass
-        return "unknown"
+        return _detect_distro_id()
     
     def _display_info(self, title, content):
         """Display the information in the log"""
-        self.log(f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", LogLevel.INFO)
-        self.log(f"{title}", LogLevel.SUCCESS)
-        self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", LogLevel.INFO)
-        
-        # 将内容按行分割，为不同类型的信息添加颜色
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # 根据内容类型设置颜色
-            if line.startswith("Error:") or line.startswith("✗"):
-                self.log(line, LogLevel.ERROR)
-            elif line.startswith("Warning:") or line.startswith("⚠"):
-                self.log(line, LogLevel.WARNING)
-            elif line.startswith("✓") or "Installed" in line or "Available" in line:
-                self.log(line, LogLevel.SUCCESS)
-            else:
-                self.log(line, LogLevel.INFO)
-        
-        self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n", LogLevel.INFO)
-        
+        with self._log_batch():
+            self.log("\n" + _SEP, LogLevel.INFO)
+            self.log(title, LogLevel.SUCCESS)
+            self.log(_SEP, LogLevel.INFO)
+
+            # 将内容按行分割，为不同类型的信息添加颜色
+            severity = {"err": LogLevel.ERROR, "warn": LogLevel.WARNING,
+                        "ok": LogLevel.SUCCESS, "mention": LogLevel.SUCCESS}
+            for line in content.split('\n'):
+                line = line.strip()
+                if not line:
+                    continue
+
+                # 根据内容类型设置颜色 - one regex scan instead of five
+                # startswith/in probes per line
+                match = _INFO_LINE_RE.search(line)
+                level = severity[match.lastgroup] if match else LogLevel.INFO
+                self.log(line, level)
+
+            self.log(_SEP + "\n", LogLevel.INFO)
+
         # 自动滚动到底部
         self.log_text.verticalScrollBar().setValue(self.log_text.verticalScrollBar().maximum())
     
     def _display_error(self, error_message):
         """Display error message"""
         self.log(f"\n{error_message}\n", LogLevel.ERROR)
+
+    def _display_progress(self, message):
+        """Display an interim status line while a worker check is running"""
+        self.log(message, LogLevel.INFO)
     
     def install_iflow_cli(self):
         """Install iFlow CLI from official repository"""
@@ -3858,39 +4321,33 @@ Please verify the information above is correct.
         self.log("="*80 + "\n", LogLevel.INFO)
         
         # 显示确认对话框
-        if PlatformHelper.is_windows():
+        if _IS_WINDOWS:
             install_command = "irm https://gitee.com/iflow-ai/iflow-cli/raw/main/install.ps1 | iex"
             message = "This will download and install iFlow CLI using PowerShell.\n\nCommand:\n" + install_command + "\n\nDo you want to continue?"
         else:
             install_script_url = "https://gitee.com/iflow-ai/iflow-cli/raw/main/install.sh"
             message = "This will download and install iFlow CLI from:\n" + install_script_url + "\n\nDo you want to continue?"
         
-        reply = QMessageBox.question(
-            self,
+        reply = self._confirm(
             "Install iFlow CLI",
-            message,
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+            message
         )
         
-        if reply != QMessageBox.StandardButton.Yes:
+        if not reply:
             self.log("Installation cancelled.\n", LogLevel.INFO)
             return
         
-        if PlatformHelper.is_windows():
+        if _IS_WINDOWS:
             # Windows: 使用 npm 安装
             self.log("Installing iFlow CLI using npm...\n", LogLevel.WARNING)
             
             try:
-                # 先检查 Node.js 是否已安装
+                # 先检查 Node.js 是否已安装 - a PATH scan answers the
+                # presence question without forking a probe process
                 self.log("Checking for Node.js...", LogLevel.INFO)
-                check_process = subprocess.run(
-                    ["node", "--version"],
-                    capture_output=True,
-                    text=True
-                )
-                
-                if check_process.returncode != 0:
+                node_path = shutil.which("node")
+
+                if node_path is None:
                     self.log("✗ Node.js not found!\n", LogLevel.ERROR)
                     self.log("iFlow CLI requires Node.js on Windows.\n", LogLevel.INFO)
                     self.log("Please install Node.js first:\n", LogLevel.INFO)
@@ -3898,53 +4355,29 @@ Please verify the information above is correct.
                     self.log("2. Download and install Node.js\n", LogLevel.INFO)
                     self.log("3. Restart this application and try again\n", LogLevel.INFO)
                     return
-                
-                self.log(f"✓ Node.js {check_process.stdout.strip()} found\n", LogLevel.SUCCESS)
+
+                self.log(f"✓ Node.js found: {node_path}\n", LogLevel.SUCCESS)
                 
                 # 使用 npm 安装 iFlow CLI
                 self.log("Installing iFlow CLI via npm...\n", LogLevel.INFO)
-                
-                process = subprocess.Popen(
-                    ["npm", "install", "-g", "@iflow-ai/iflow-cli@latest"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True
-                )
-                
-                def read_output():
-                    while True:
-                        output = process.stdout.readline()
-                        if output == '' and process.poll() is not None:
-                            break
-                        if output:
-                            self.log(output.strip(), LogLevel.INFO)
-                            QApplication.processEvents()
-                
-                import threading
-                output_thread = threading.Thread(target=read_output)
-                output_thread.daemon = True
-                output_thread.start()
-                
-                return_code = process.wait()
-                output_thread.join(timeout=30)
-                
-                if return_code == 0:
-                    self.log("\n✓ iFlow CLI installed successfully!\n", LogLevel.SUCCESS)
-                    self.log("You can now use 'iflow' command in PowerShell.\n", LogLevel.INFO)
-                    
-                    # 验证安装
-                    verify_process = subprocess.run(
-                        ["iflow", "--version"],
-                        capture_output=True,
-                        text=True
-                    )
-                    if verify_process.returncode == 0:
-                        self.log(f"✓ Verified: iFlow CLI {verify_process.stdout.strip()}\n", LogLevel.SUCCESS)
-                else:
-                    self.log(f"\n✗ Installation failed, error code: {return_code}\n", LogLevel.ERROR)
-                    
+
+                def on_finished(return_code):
+                    if return_code == 0:
+                        self.log("\n✓ iFlow CLI installed successfully!\n", LogLevel.SUCCESS)
+                        self.log("You can now use 'iflow' command in PowerShell.\n", LogLevel.INFO)
+
+                        # 验证安装 - cached probe, so a re-install of the
+                        # same binary never re-forks the version check
+                        version = _cached_tool_version("iflow")
+                        if version:
+                            self.log(f"✓ Verified: iFlow CLI {version}\n", LogLevel.SUCCESS)
+                    else:
+                        self.log(f"\n✗ Installation failed, error code: {return_code}\n", LogLevel.ERROR)
+
+                # Drained through the event loop - no reader thread and
+                # no blocking wait on the GUI thread
+                self._run_streamed(["npm", "install", "-g", "@iflow-ai/iflow-cli@latest"], on_finished)
+
             except FileNotFoundError:
                 self.log("✗ npm command not found!\n", LogLevel.ERROR)
                 self.log("Please install Node.js from: https://nodejs.org/zh-cn/download\n", LogLevel.INFO)
@@ -3958,60 +4391,49 @@ Please verify the information above is correct.
             temp_dir = tempfile.mkdtemp()
             install_script_path = os.path.join(temp_dir, "install.sh")
             
-            try:
-                # Download install script
-                import urllib.request
-                urllib.request.urlretrieve(install_script_url, install_script_path)
-                self.log("Download completed successfully.\n", LogLevel.SUCCESS)
-                
-                # Make script executable
-                os.chmod(install_script_path, 0o755)
-                
-                # Run install script
-                self.log("Running iFlow CLI installer...\n", LogLevel.WARNING)
-                
-                process = subprocess.Popen(
-                    ["bash", install_script_path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True
-                )
-                
-                def read_output():
-                    while True:
-                        output = process.stdout.readline()
-                        if output == '' and process.poll() is not None:
-                            break
-                        if output:
-                            self.log(output.strip(), LogLevel.INFO)
-                            QApplication.processEvents()
-                
-                import threading
-                output_thread = threading.Thread(target=read_output)
-                output_thread.daemon = True
-                output_thread.start()
-                
-                return_code = process.wait()
-                output_thread.join(timeout=2)
-                
-                # Cleanup
-                import shutil
-                shutil.rmtree(temp_dir)
-                
-                if return_code == 0:
-                    self.log("\n✓ iFlow CLI installed successfully!\n", LogLevel.SUCCESS)
-                    self.log("You can now use 'iflow' command in your terminal.\n", LogLevel.INFO)
-                else:
-                    self.log(f"\n✗ Installation failed, error code: {return_code}\n", LogLevel.ERROR)
-                    
-            except Exception as e:
-                self.log(f"\n✗ Error during installation: {str(e)}\n", LogLevel.ERROR)
-                # Cleanup on error
-                import shutil
-                if os.path.exists(temp_dir):
-                    shutil.rmtree(temp_dir)
+            def download():
+                # Network I/O on a worker thread; the result is
+                # marshalled back through stream_finished_signal
+                error = None
+                try:
+                    # Download with a 1 MiB copy buffer (urlretrieve
+                    # loops over 8 KiB reads internally)
+                    with urllib.request.urlopen(install_script_url, timeout=30) as response, \
+                            open(install_script_path, 'wb') as script_file:
+                        shutil.copyfileobj(response, script_file, 1 << 20)
+                    # Make script executable
+                    os.chmod(install_script_path, 0o755)
+                except Exception as e:
+                    error = e
+                self.stream_finished_signal.emit(
+                    functools.partial(self._iflow_on_downloaded, temp_dir,
+                                      install_script_path, error), 0)
+
+            threading.Thread(target=download, daemon=True).start()
+
+    def _iflow_on_downloaded(self, temp_dir, install_script_path, error, _rc):
+        """Continue the iFlow install once the script download finished"""
+        if error is not None:
+            self.log(f"\n✗ Error during installation: {str(error)}\n", LogLevel.ERROR)
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return
+
+        self.log("Download completed successfully.\n", LogLevel.SUCCESS)
+        self.log("Running iFlow CLI installer...\n", LogLevel.WARNING)
+
+        def on_finished(return_code):
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            if return_code == 0:
+                self.log("\n✓ iFlow CLI installed successfully!\n", LogLevel.SUCCESS)
+                self.log("You can now use 'iflow' command in your terminal.\n", LogLevel.INFO)
+            else:
+                self.log(f"\n✗ Installation failed, error code: {return_code}\n", LogLevel.ERROR)
+
+        try:
+            self._run_streamed(["bash", install_script_path], on_finished)
+        except Exception as e:
+            self.log(f"\n✗ Error during installation: {str(e)}\n", LogLevel.ERROR)
+            shutil.rmtree(temp_dir, ignore_errors=True)
     
     def clear_iflow_history(self):
         """Clear iFlow CLI command history"""
@@ -4019,7 +4441,7 @@ Please verify the information above is correct.
         self.log("Clear iFlow CLI Command History", LogLevel.WARNING)
         self.log("="*80 + "\n", LogLevel.INFO)
         
-        if PlatformHelper.is_windows():
+        if _IS_WINDOWS:
             # Windows
             appdata = os.environ.get('APPDATA')
             if not appdata:
@@ -4038,40 +4460,74 @@ Please verify the information above is correct.
             return
         
         # 显示确认对话框
-        reply = QMessageBox.question(
-            self,
+        reply = self._confirm(
             "Clear iFlow CLI History",
-            f"This will clear the iFlow CLI command history directory:\n{history_dir}\n\nAll history files will be deleted.\nDo you want to continue?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
+            f"This will clear the iFlow CLI command history directory:\n{history_dir}\n\nAll history files will be deleted.\nDo you want to continue?"
         )
         
-        if reply != QMessageBox.StandardButton.Yes:
+        if not reply:
             self.log("Operation cancelled.\n", LogLevel.INFO)
             return
         
+        # Fast path: atomically rename the directory aside, recreate it
+        # empty, and unlink the old tree in the background - the
+        # user-visible clear is a single O(1) rename
+        trash_dir = history_dir + ".trash-" + uuid.uuid4().hex
         try:
-            # Delete all files and subdirectories in the history directory
-            import shutil
-            deleted_count = 0
-            for item in os.listdir(history_dir):
-                item_path = os.path.join(history_dir, item)
-                if os.path.isfile(item_path):
-                    os.remove(item_path)
-                    deleted_count += 1
-                elif os.path.isdir(item_path):
-                    shutil.rmtree(item_path)
-                    deleted_count += 1
-            
+            os.rename(history_dir, trash_dir)
+        except OSError:
+            # Cross-device or permission trouble: fall back to the
+            # in-place deletion loop, which reports errors properly
+            trash_dir = None
+        if trash_dir is not None:
+            os.makedirs(history_dir, exist_ok=True)
+            threading.Thread(target=shutil.rmtree, args=(trash_dir,),
+                             kwargs={"ignore_errors": True}, daemon=True).start()
             self.log(f"✓ History directory cleared: {history_dir}\n", LogLevel.SUCCESS)
-            self.log(f"Deleted {deleted_count} item(s) from iFlow CLI history.\n", LogLevel.INFO)
             self.log("iFlow CLI command history has been cleared.\n", LogLevel.INFO)
-            
-        except PermissionError:
+            return
+
+        def delete_all():
+            # Runs on a worker thread: unlink work is syscall-bound and
+            # must not stall the GUI; the result is marshalled back
+            # through stream_finished_signal like any other background job
+            deleted_count = 0
+            error = None
+            try:
+                # scandir entries carry the d_type from the directory
+                # read, so no extra stat per item
+                with os.scandir(history_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            os.remove(entry.path)
+                            deleted_count += 1
+                        elif entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                            deleted_count += 1
+                        else:
+                            # Symlinks (including broken ones) unlink fine
+                            os.remove(entry.path)
+                            deleted_count += 1
+            except Exception as e:
+                error = e
+            self.stream_finished_signal.emit(
+                functools.partial(self._on_history_cleared, history_dir, error),
+                deleted_count)
+
+        self.log("Clearing history in the background...\n", LogLevel.INFO)
+        threading.Thread(target=delete_all, daemon=True).start()
+
+    def _on_history_cleared(self, history_dir, error, deleted_count):
+        """Report the outcome of a background history clear (GUI thread)"""
+        if isinstance(error, PermissionError):
             self.log(f"✗ Permission denied: Cannot access {history_dir}\n", LogLevel.ERROR)
             self.log("Try running the application as administrator.\n", LogLevel.INFO)
-        except Exception as e:
-            self.log(f"✗ Error clearing history directory: {str(e)}\n", LogLevel.ERROR)
+        elif error is not None:
+            self.log(f"✗ Error clearing history directory: {str(error)}\n", LogLevel.ERROR)
+        else:
+            self.log(f"✓ History directory cleared: {history_dir}\n", LogLevel.SUCCESS)
+            self.log(f"Deleted {deleted_count} item(s) from iFlow CLI history.\n", LogLevel.INFO)
+            self.log("iFlow CLI command history has been cleared.\n", LogLevel.INFO)
 
 
 def main():